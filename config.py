@@ -27,6 +27,7 @@ VERSION_HISTORY = {
     "2.1.1": "통장 보호 + 주둥이 봉인 (2026-01-05)",
 }
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 import os
 from pathlib import Path
@@ -52,7 +53,7 @@ ENFORCE_OUTPUT_CONTRACT = os.getenv("ENFORCE_OUTPUT_CONTRACT", "true").lower() =
 CONTRACT_EXEMPT_AGENTS = {"pm", "researcher", "analyst"}
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     """LLM 모델 설정"""
     name: str
@@ -63,6 +64,12 @@ class ModelConfig:
     max_tokens: int = 4096
     thinking_mode: bool = False  # GPT-5.2 Thinking Extend 모드
     reasoning_effort: Optional[str] = None  # GPT-5.2: "high", "xhigh", None (Extended Thinking)
+    profile: str = "coder"  # claude_cli provider용 CLI 프로필
+    # anthropic → CLI 리다이렉트 시 쓸 프로필 (생성 시 1회 계산)
+    cli_redirect_profile: str = field(init=False, default="reviewer")
+
+    def __post_init__(self):
+        self.cli_redirect_profile = "coder" if "opus" in self.model_id.lower() else "reviewer"
 
 
 @dataclass
@@ -1252,6 +1259,7 @@ def get_ceo_profile() -> str:
     return CEO_PROFILE
 
 
+@lru_cache(maxsize=32)
 def get_system_prompt(role: str) -> str:
     """
     시스템 프롬프트 가져오기 (v2.4 Persona Pack)
@@ -1261,6 +1269,8 @@ def get_system_prompt(role: str) -> str:
     2. SYSTEM_PROMPTS[role] (레거시 폴백)
 
     페르소나 파일 사용 시 GLOBAL_RULES.md를 자동으로 prepend함.
+    모든 call_agent 호출이 거치는 핫패스 - 역할별로 메모이즈.
+    (파일 없는 역할도 매번 stat하지 않도록 미스까지 캐싱)
     """
     persona_prompt = _load_persona(role)
     if persona_prompt:
@@ -1341,6 +1351,7 @@ def clear_persona_cache():
     global _persona_cache, _global_rules_cache
     _persona_cache = {}
     _global_rules_cache = None
+    get_system_prompt.cache_clear()
     print("[Persona] Cache cleared")
 
 
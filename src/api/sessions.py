@@ -7,6 +7,7 @@ v2.2.5: RLS (Row Level Security) 추가
 - admin 계정은 모든 세션 접근 가능
 """
 from flask import request, jsonify
+from flask.views import MethodView
 from flask_login import current_user
 
 from . import session_bp
@@ -31,105 +32,119 @@ def check_session_access(session_data):
     return session_data.get('project') in allowed
 
 
-@session_bp.route('', methods=['GET'])
-def list_sessions():
-    """세션 목록 조회 (RLS 적용)"""
-    allowed = get_user_allowed_projects()
-    sessions = db.list_sessions(limit=50, allowed_projects=allowed)
-    return jsonify(sessions)
-
-
-@session_bp.route('', methods=['POST'])
-def create_session():
-    """새 세션 생성
+class SessionCollection(MethodView):
+    """세션 컬렉션 리소스 (GET 목록 / POST 생성)
 
-    v2.6.9: parent_session_id 지원 - 이전 세션에서 이어가기
+    URL당 단일 MethodView로 통합 → werkzeug 라우팅 테이블에
+    메서드별 Rule 대신 하나의 Rule만 생성됨.
     """
-    data = request.json or {}
-    name = data.get('name')
-    project = data.get('project')
-    agent = data.get('agent', 'pm')
-    parent_session_id = data.get('parent_session_id')  # v2.6.9: 이전 세션 연결
-
-    # RLS: 제한된 사용자는 허용된 프로젝트에만 세션 생성 가능
-    allowed = get_user_allowed_projects()
-    if allowed is not None and project and project not in allowed:
-        return jsonify({'error': 'Access denied: project not allowed'}), 403
-
-    # parent_session_id가 있으면 이전 세션 접근 권한 확인
-    parent_context = None
-    if parent_session_id:
-        parent_session = db.get_session(parent_session_id)
-        if parent_session and check_session_access(parent_session):
-            # 이전 세션 컨텍스트 가져오기
-            try:
-                from src.services.session_memory import get_parent_session_context
-                parent_context = get_parent_session_context(parent_session_id)
-            except Exception as e:
-                print(f"[Session] Failed to get parent context: {e}")
-        else:
-            return jsonify({'error': 'Parent session not found or access denied'}), 403
-
-    session_id = db.create_session(
-        name=name,
-        project=project,
-        agent=agent,
-        parent_session_id=parent_session_id
-    )
-    set_current_session(session_id)
 
-    return jsonify({
-        'session_id': session_id,
-        'status': 'created',
-        'parent_session_id': parent_session_id,
-        'parent_context': parent_context[:500] + '...' if parent_context and len(parent_context) > 500 else parent_context
-    })
-
-
-@session_bp.route('/<session_id>', methods=['GET'])
-def get_session(session_id: str):
-    """세션 상세 조회 (RLS 적용)"""
-    session_data = db.get_session(session_id)
-    if not session_data:
+    def get(self):
+        """세션 목록 조회 (RLS 적용)"""
+        allowed = get_user_allowed_projects()
+        sessions = db.list_sessions(limit=50, allowed_projects=allowed)
+        return jsonify(sessions)
+
+    def post(self):
+        """새 세션 생성
+
+        v2.6.9: parent_session_id 지원 - 이전 세션에서 이어가기
+        """
+        data = request.json or {}
+        name = data.get('name')
+        project = data.get('project')
+        agent = data.get('agent', 'pm')
+        parent_session_id = data.get('parent_session_id')  # v2.6.9: 이전 세션 연결
+
+        # RLS: 제한된 사용자는 허용된 프로젝트에만 세션 생성 가능
+        allowed = get_user_allowed_projects()
+        if allowed is not None and project and project not in allowed:
+            return jsonify({'error': 'Access denied: project not allowed'}), 403
+
+        # parent_session_id가 있으면 이전 세션 접근 권한 확인
+        parent_context = None
+        if parent_session_id:
+            parent_session = db.get_session(parent_session_id)
+            if parent_session and check_session_access(parent_session):
+                # 이전 세션 컨텍스트 가져오기
+                try:
+                    from src.services.session_memory import get_parent_session_context
+                    parent_context = get_parent_session_context(parent_session_id)
+                except Exception as e:
+                    print(f"[Session] Failed to get parent context: {e}")
+            else:
+                return jsonify({'error': 'Parent session not found or access denied'}), 403
+
+        session_id = db.create_session(
+            name=name,
+            project=project,
+            agent=agent,
+            parent_session_id=parent_session_id
+        )
+        set_current_session(session_id)
+
+        return jsonify({
+            'session_id': session_id,
+            'status': 'created',
+            'parent_session_id': parent_session_id,
+            'parent_context': parent_context[:500] + '...' if parent_context and len(parent_context) > 500 else parent_context
+        })
+
+
+class SessionResource(MethodView):
+    """단일 세션 리소스 (GET 조회 / PUT 수정 / DELETE 삭제)"""
+
+    def get(self, session_id: str):
+        """세션 상세 조회 (RLS 적용)"""
+        session_data = db.get_session(session_id)
+        if not session_data:
+            return jsonify({'error': 'Session not found'}), 404
+        if not check_session_access(session_data):
+            return jsonify({'error': 'Access denied'}), 403
+        return jsonify(session_data)
+
+    def put(self, session_id: str):
+        """세션 업데이트 (RLS 적용)"""
+        session_data = db.get_session(session_id)
+        if not check_session_access(session_data):
+            return jsonify({'error': 'Access denied'}), 403
+
+        data = request.json or {}
+        success = db.update_session(
+            session_id,
+            name=data.get('name'),
+            project=data.get('project'),
+            agent=data.get('agent')
+        )
+        if success:
+            return jsonify({'status': 'updated'})
         return jsonify({'error': 'Session not found'}), 404
-    if not check_session_access(session_data):
-        return jsonify({'error': 'Access denied'}), 403
-    return jsonify(session_data)
-
 
-@session_bp.route('/<session_id>', methods=['PUT'])
-def update_session(session_id: str):
-    """세션 업데이트 (RLS 적용)"""
-    session_data = db.get_session(session_id)
-    if not check_session_access(session_data):
-        return jsonify({'error': 'Access denied'}), 403
+    def delete(self, session_id: str):
+        """세션 삭제 (RLS 적용)"""
+        session_data = db.get_session(session_id)
+        if not check_session_access(session_data):
+            return jsonify({'error': 'Access denied'}), 403
+
+        current_session_id = get_current_session()
+        success = db.delete_session(session_id)
+        if success:
+            if current_session_id == session_id:
+                set_current_session(None)
+            return jsonify({'status': 'deleted'})
+        return jsonify({'error': 'Session not found'}), 404
 
-    data = request.json or {}
-    success = db.update_session(
-        session_id,
-        name=data.get('name'),
-        project=data.get('project'),
-        agent=data.get('agent')
-    )
-    if success:
-        return jsonify({'status': 'updated'})
-    return jsonify({'error': 'Session not found'}), 404
-
-
-@session_bp.route('/<session_id>', methods=['DELETE'])
-def delete_session(session_id: str):
-    """세션 삭제 (RLS 적용)"""
-    session_data = db.get_session(session_id)
-    if not check_session_access(session_data):
-        return jsonify({'error': 'Access denied'}), 403
 
-    current_session_id = get_current_session()
-    success = db.delete_session(session_id)
-    if success:
-        if current_session_id == session_id:
-            set_current_session(None)
-        return jsonify({'status': 'deleted'})
-    return jsonify({'error': 'Session not found'}), 404
+session_bp.add_url_rule(
+    '',
+    view_func=SessionCollection.as_view('session_collection'),
+    strict_slashes=False,
+)
+session_bp.add_url_rule(
+    '/<session_id>',
+    view_func=SessionResource.as_view('session_resource'),
+    strict_slashes=False,
+)
 
 
 @session_bp.route('/<session_id>/messages', methods=['GET'])
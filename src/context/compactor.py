@@ -8,6 +8,9 @@ CEO 완성본 - Preemptive Compaction (85% 임계치)
 3. LLM 기반 또는 휴리스틱 압축
 """
 from __future__ import annotations
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
@@ -20,10 +23,42 @@ class Message:
     """대화 메시지"""
     role: str  # user, assistant, system
     content: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    # datetime.utcnow() 대신 정수 ns 타임스탬프 기록, datetime 변환은 지연 수행
+    timestamp_ns: int = field(default_factory=time.time_ns)
     metadata: Dict[str, Any] = field(default_factory=dict)
     preserve: bool = False  # True면 압축에서 제외
 
+    @property
+    def timestamp(self) -> datetime:
+        """UTC datetime (지연 변환)"""
+        return datetime.utcfromtimestamp(self.timestamp_ns / 1e9)
+
+
+class MessageView(Sequence):
+    """
+    메시지 목록 읽기 전용 뷰
+
+    get_messages()가 매번 리스트를 복사하지 않도록 내부 리스트를
+    O(1)로 감싼다. 인덱싱/순회는 가능하지만 수정은 불가.
+    """
+
+    __slots__ = ("_messages",)
+
+    def __init__(self, messages: List[Message]):
+        self._messages = messages
+
+    def __getitem__(self, index):
+        result = self._messages[index]
+        if isinstance(index, slice):
+            return MessageView(result)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __repr__(self) -> str:
+        return f"MessageView({self._messages!r})"
+
 
 @dataclass
 class CompactionResult:
@@ -50,16 +85,19 @@ class Compactor:
         counter: Optional[TokenCounter] = None,
         llm_summarizer: Optional[Callable[[str], str]] = None,
         target_ratio: float = 0.5,
+        chunk_tokens: int = 4000,
     ):
         """
         Args:
             counter: TokenCounter 인스턴스 (없으면 자동 생성)
             llm_summarizer: LLM 요약 함수 (prompt → summary)
             target_ratio: 압축 목표 비율 (기본 50%)
+            chunk_tokens: map-reduce 요약 시 청크당 토큰 수
         """
         self.counter = counter or TokenCounter()
         self.llm_summarizer = llm_summarizer
         self.target_ratio = target_ratio
+        self.chunk_tokens = chunk_tokens
 
         self._messages: List[Message] = []
 
@@ -145,25 +183,14 @@ class Compactor:
         preserved: List[Message],
         original_tokens: int,
     ) -> CompactionResult:
-        """LLM 기반 압축"""
+        """LLM 기반 압축 (map-reduce)"""
         try:
-            # 압축 대상 텍스트 구성
-            text_to_summarize = self._format_messages(compactable)
-
             # 목표 토큰 수
             target_tokens = int(original_tokens * self.target_ratio)
             preserved_tokens = sum(estimate_tokens(m.content) for m in preserved)
             summary_budget = max(500, target_tokens - preserved_tokens)
 
-            prompt = f"""다음 대화를 {summary_budget} 토큰 이내로 요약하세요.
-핵심 정보, 결정 사항, 중요한 컨텍스트를 보존하세요.
-
-[대화 내용]
-{text_to_summarize}
-
-[요약]"""
-
-            summary = self.llm_summarizer(prompt)
+            summary = self._summarize_map_reduce(compactable, summary_budget)
             summary_tokens = estimate_tokens(summary)
 
             # 메시지 재구성
@@ -201,6 +228,86 @@ class Compactor:
                 method="llm"
             )
 
+    def _summarize_map_reduce(
+        self,
+        compactable: List[Message],
+        summary_budget: int,
+    ) -> str:
+        """
+        Map-reduce 요약
+
+        히스토리를 chunk_tokens 단위로 분할 → 청크별 병렬 요약(map)
+        → 부분 요약들을 하나로 압축(reduce).
+
+        단일 거대 프롬프트 대비 지연시간 O(total) → O(chunk) + O(K),
+        청크가 1개면 기존 단일 호출과 동일하게 동작.
+        """
+        chunks = self._split_by_tokens(compactable, self.chunk_tokens)
+
+        if len(chunks) <= 1:
+            return self.llm_summarizer(
+                self._build_summary_prompt(
+                    self._format_messages(compactable), summary_budget
+                )
+            )
+
+        # Map: 청크별 병렬 요약
+        chunk_budget = max(300, summary_budget // len(chunks))
+
+        def summarize_chunk(chunk: List[Message]) -> str:
+            return self.llm_summarizer(
+                self._build_summary_prompt(self._format_messages(chunk), chunk_budget)
+            )
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            partials = list(executor.map(summarize_chunk, chunks))
+
+        # Reduce: 부분 요약 통합
+        combined = "\n\n".join(
+            f"[구간 {i + 1} 요약]\n{partial}" for i, partial in enumerate(partials)
+        )
+        reduce_prompt = f"""다음 구간별 요약들을 {summary_budget} 토큰 이내의 단일 요약으로 통합하세요.
+핵심 정보, 결정 사항, 중요한 컨텍스트를 보존하세요.
+
+{combined}
+
+[통합 요약]"""
+        return self.llm_summarizer(reduce_prompt)
+
+    @staticmethod
+    def _build_summary_prompt(text: str, budget: int) -> str:
+        """요약 프롬프트 구성"""
+        return f"""다음 대화를 {budget} 토큰 이내로 요약하세요.
+핵심 정보, 결정 사항, 중요한 컨텍스트를 보존하세요.
+
+[대화 내용]
+{text}
+
+[요약]"""
+
+    @staticmethod
+    def _split_by_tokens(
+        messages: List[Message],
+        chunk_tokens: int,
+    ) -> List[List[Message]]:
+        """메시지를 누적 토큰 기준으로 청크 분할"""
+        chunks: List[List[Message]] = []
+        current: List[Message] = []
+        current_tokens = 0
+
+        for msg in messages:
+            msg_tokens = estimate_tokens(msg.content)
+            if current and current_tokens + msg_tokens > chunk_tokens:
+                chunks.append(current)
+                current = []
+                current_tokens = 0
+            current.append(msg)
+            current_tokens += msg_tokens
+
+        if current:
+            chunks.append(current)
+        return chunks
+
     def _compact_heuristic(
         self,
         compactable: List[Message],
@@ -265,9 +372,9 @@ class Compactor:
             lines.append(f"[{role_label}]\n{msg.content}\n")
         return "\n".join(lines)
 
-    def get_messages(self) -> List[Message]:
-        """현재 메시지 목록"""
-        return self._messages.copy()
+    def get_messages(self) -> MessageView:
+        """현재 메시지 목록 (읽기 전용 뷰 — 복사 없음)"""
+        return MessageView(self._messages)
 
     def get_context(self) -> str:
         """현재 컨텍스트를 텍스트로 반환"""
@@ -8,15 +8,27 @@ CEO 완성본 - 토큰 사용량 추적
 3. 임계치 도달 알림
 """
 from __future__ import annotations
+import bisect
+import math
+import time
+from functools import lru_cache
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+# 한글 음절 블록 (가-힣, U+AC00~U+D7A3) 전체를 삭제하는 translate 테이블
+# len(text) - len(translate 결과) = 한글 글자 수 — 매치 객체 생성 없는 C 레벨 카운트
+_HANGUL_DELETE_TABLE = dict.fromkeys(range(0xAC00, 0xD7A4))
 
+
+@lru_cache(maxsize=2048)
 def estimate_tokens(text: str) -> int:
     """
     토큰 수 추정 (간단한 휴리스틱)
 
+    같은 내용이 압축/트림 과정에서 반복 추정되므로 LRU 캐시로 메모이즈
+    (str 해시가 캐시 키)
+
     - 영문: 4글자 ≈ 1토큰
     - 한글: 1.5글자 ≈ 1토큰
     - 코드: 3글자 ≈ 1토큰
@@ -27,8 +39,8 @@ def estimate_tokens(text: str) -> int:
     if not text:
         return 0
 
-    # 한글 카운트
-    korean_chars = sum(1 for c in text if '\uac00' <= c <= '\ud7a3')
+    # 한글 카운트 (str.translate 삭제 트릭 — 길이 차이로 계산)
+    korean_chars = len(text) - len(text.translate(_HANGUL_DELETE_TABLE))
     # 나머지 (영문, 코드, 특수문자)
     other_chars = len(text) - korean_chars
 
@@ -39,14 +51,21 @@ def estimate_tokens(text: str) -> int:
     return int(korean_tokens + other_tokens)
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     """단일 메시지 토큰 사용량"""
     role: str  # user, assistant, system
     content_tokens: int
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    # datetime.utcnow()는 생성 비용이 큼 → 정수 ns 타임스탬프만 기록하고
+    # datetime 변환은 실제로 읽을 때 지연 수행
+    timestamp_ns: int = field(default_factory=time.time_ns)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def timestamp(self) -> datetime:
+        """UTC datetime (지연 변환)"""
+        return datetime.utcfromtimestamp(self.timestamp_ns / 1e9)
+
 
 class TokenCounter:
     """
@@ -71,8 +90,18 @@ class TokenCounter:
         self.warning_threshold = warning_threshold
         self.compaction_threshold = compaction_threshold
 
+        # 임계치를 절대 토큰 수로 미리 환산 → should_warn/should_compact가
+        # 매 호출 비율 계산 없이 정수 비교 한 번으로 끝남
+        self._warn_tokens = math.ceil(max_tokens * warning_threshold)
+        self._compact_tokens = math.ceil(max_tokens * compaction_threshold)
+
         self._history: List[TokenUsage] = []
         self._total_tokens: int = 0
+        # 역할별 누계를 add/trim 시점에 갱신 → get_stats가 히스토리 재스캔 안 함
+        self._role_tokens: Dict[str, int] = {}
+        # 누적 토큰 prefix-sum (_prefix_tokens[i] = 0..i번 메시지 토큰 합)
+        # → 트림 시 제거 토큰 수를 합산 루프 없이 O(1)/O(log N)으로 계산
+        self._prefix_tokens: List[int] = []
 
     @property
     def total_tokens(self) -> int:
@@ -91,13 +120,13 @@ class TokenCounter:
 
     @property
     def should_warn(self) -> bool:
-        """경고 필요 여부"""
-        return self.usage_ratio >= self.warning_threshold
+        """경고 필요 여부 (절대 토큰 수 비교 fast path)"""
+        return self._total_tokens >= self._warn_tokens
 
     @property
     def should_compact(self) -> bool:
-        """압축 필요 여부"""
-        return self.usage_ratio >= self.compaction_threshold
+        """압축 필요 여부 (절대 토큰 수 비교 fast path)"""
+        return self._total_tokens >= self._compact_tokens
 
     def add(
         self,
@@ -129,6 +158,10 @@ class TokenCounter:
 
         self._history.append(usage)
         self._total_tokens += tokens
+        self._role_tokens[role] = self._role_tokens.get(role, 0) + tokens
+        self._prefix_tokens.append(
+            (self._prefix_tokens[-1] if self._prefix_tokens else 0) + tokens
+        )
 
         return usage
 
@@ -146,16 +179,15 @@ class TokenCounter:
         }
 
     def _tokens_by_role(self) -> Dict[str, int]:
-        """역할별 토큰 수"""
-        result: Dict[str, int] = {}
-        for usage in self._history:
-            result[usage.role] = result.get(usage.role, 0) + usage.content_tokens
-        return result
+        """역할별 토큰 수 (러닝 카운터 복사본)"""
+        return dict(self._role_tokens)
 
     def reset(self) -> None:
         """카운터 리셋"""
         self._history.clear()
         self._total_tokens = 0
+        self._role_tokens.clear()
+        self._prefix_tokens.clear()
 
     def set_tokens(self, tokens: int) -> None:
         """압축 후 토큰 수 직접 설정"""
@@ -174,10 +206,42 @@ class TokenCounter:
         if len(self._history) <= keep_last:
             return 0
 
-        removed = self._history[:-keep_last]
-        self._history = self._history[-keep_last:]
+        cut = len(self._history) - keep_last
+        return self._remove_oldest(cut)
+
+    def trim_to_tokens(self, max_tokens: int) -> int:
+        """
+        토큰 예산 기준 트림 (오래된 것부터 제거)
+
+        prefix-sum에 bisect를 적용해 제거 경계를 O(log N)으로 탐색
+
+        Args:
+            max_tokens: 트림 후 유지할 최대 토큰 수
+
+        Returns:
+            제거된 토큰 수
+        """
+        if self._total_tokens <= max_tokens or not self._history:
+            return 0
+
+        # 앞에서 최소 removed_budget 토큰 이상을 제거해야 함
+        removed_budget = self._total_tokens - max_tokens
+        cut = bisect.bisect_left(self._prefix_tokens, removed_budget) + 1
+        cut = min(cut, len(self._history))
+
+        return self._remove_oldest(cut)
+
+    def _remove_oldest(self, cut: int) -> int:
+        """앞에서 cut개 메시지 제거 + 누계/프리픽스 재계산"""
+        removed = self._history[:cut]
+        self._history = self._history[cut:]
+
+        # prefix-sum 차분으로 제거 토큰 합을 O(1)에 획득
+        removed_tokens = self._prefix_tokens[cut - 1]
+        self._prefix_tokens = [p - removed_tokens for p in self._prefix_tokens[cut:]]
 
-        removed_tokens = sum(u.content_tokens for u in removed)
+        for u in removed:
+            self._role_tokens[u.role] = self._role_tokens.get(u.role, 0) - u.content_tokens
         self._total_tokens -= removed_tokens
 
         return removed_tokens
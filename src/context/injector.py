@@ -46,37 +46,31 @@ class ContextInjector:
         self._session_rules = session_rules
         self._constitution = constitution
 
+        # 규정이 바뀔 때만 재계산되는 고정 프리픽스 캐시
+        # (프롬프트 앞부분이 매 호출 동일하면 LLM 측 KV-cache/prefix-cache 재사용 가능)
+        self._worker_prefix: Optional[str] = None
+        self._reviewer_prefix: Optional[str] = None
+
     def set_session_rules(self, session_rules: SessionRules) -> None:
-        """세션 규정 설정"""
+        """세션 규정 설정 (프리픽스 캐시 무효화)"""
         self._session_rules = session_rules
+        self._worker_prefix = None
+        self._reviewer_prefix = None
 
-    def build_worker_prompt(
-        self,
-        role: str,
-        task: str,
-        additional_context: str = "",
-    ) -> InjectedPrompt:
-        """
-        Worker 프롬프트 빌드
-
-        Args:
-            role: Worker 역할 (coder, qa, analyst 등)
-            task: 수행할 태스크
-            additional_context: 추가 컨텍스트
-
-        Returns:
-            InjectedPrompt
-        """
-        rules = self._session_rules
-        if rules is None:
-            from src.control.rules import SessionRules
-            rules = SessionRules(
+    def _resolve_rules(self) -> SessionRules:
+        """현재 규정 반환 (없으면 기본값 생성)"""
+        if self._session_rules is None:
+            self._session_rules = SessionRules(
                 session_id="default",
                 mode="dev",
                 risk_profile="normal"
             )
+        return self._session_rules
 
-        system_prompt = f"""{self._constitution}
+    def _get_worker_prefix(self, rules: SessionRules) -> str:
+        """Worker 프롬프트 고정 프리픽스 (Constitution + 세션 컨텍스트 + 규정 요약)"""
+        if self._worker_prefix is None:
+            self._worker_prefix = f"""{self._constitution}
 
 [SESSION CONTEXT]
 - Session ID: {rules.session_id}
@@ -89,16 +83,47 @@ class ContextInjector:
 - Forbid Infinite Loop: {rules.rules.code.forbid_infinite_loop}
 - Allow Skip Tests: {rules.rules.quality.allow_skip_tests}
 - Max Files Changed: {rules.rules.quality.max_files_changed}
+"""
+        return self._worker_prefix
 
-[ROLE]
-You are a {role}. Follow the Constitution and Session Rules strictly.
-
-[ADDITIONAL CONTEXT]
-{additional_context}
+    def _get_reviewer_prefix(self, rules: SessionRules) -> str:
+        """Reviewer 프롬프트 고정 프리픽스 (Constitution + 규정 JSON)"""
+        if self._reviewer_prefix is None:
+            self._reviewer_prefix = f"""{self._constitution}
 
-[TASK]
-{task}
+[SESSION RULES JSON]
+{rules.canonical_json()}
 """
+        return self._reviewer_prefix
+
+    def build_worker_prompt(
+        self,
+        role: str,
+        task: str,
+        additional_context: str = "",
+    ) -> InjectedPrompt:
+        """
+        Worker 프롬프트 빌드
+
+        Args:
+            role: Worker 역할 (coder, qa, analyst 등)
+            task: 수행할 태스크
+            additional_context: 추가 컨텍스트
+
+        Returns:
+            InjectedPrompt
+        """
+        rules = self._resolve_rules()
+
+        # 거대 f-string 대신 섹션 리스트 + join (중간 문자열 재할당 없음)
+        sections = [
+            self._get_worker_prefix(rules),
+            "\n[ROLE]\nYou are a ", role,
+            ". Follow the Constitution and Session Rules strictly.\n",
+            "\n[ADDITIONAL CONTEXT]\n", additional_context, "\n",
+            "\n[TASK]\n", task, "\n",
+        ]
+        system_prompt = "".join(sections)
 
         return InjectedPrompt(
             system_prompt=system_prompt,
@@ -130,36 +155,26 @@ You are a {role}. Follow the Constitution and Session Rules strictly.
         Returns:
             InjectedPrompt
         """
-        rules = self._session_rules
-        if rules is None:
-            from src.control.rules import SessionRules
-            rules = SessionRules(
-                session_id="default",
-                mode="dev",
-                risk_profile="normal"
-            )
-
-        system_prompt = f"""{self._constitution}
-
-[SESSION RULES JSON]
-{rules.canonical_json()}
-
-[STATIC GATE REPORT]
-{static_report or "No violations found."}
+        rules = self._resolve_rules()
 
+        sections = [
+            self._get_reviewer_prefix(rules),
+            "\n[STATIC GATE REPORT]\n", static_report or "No violations found.", "\n",
+            """
 [ROLE]
 You are the Reviewer/Gatekeeper. Enforce Constitution + Session Rules.
 If any violation exists, output REJECT.
 
 [INPUTS]
-- Session ID: {rules.session_id}
-- Rules Hash: {rules.rules_hash()}
-- Rule Version: {rules.rule_version}
-- Task: {task}
-- Worker Output: {worker_output}
-- Diff/Files Changed: {diff_summary}
-- Test Results: {test_results}
-
+""",
+            f"- Session ID: {rules.session_id}\n",
+            f"- Rules Hash: {rules.rules_hash()}\n",
+            f"- Rule Version: {rules.rule_version}\n",
+            "- Task: ", task, "\n",
+            "- Worker Output: ", worker_output, "\n",
+            "- Diff/Files Changed: ", diff_summary, "\n",
+            "- Test Results: ", test_results, "\n",
+            """
 [CHECK ORDER]
 1) Safety/Integrity (secrets, live-trade risk, infinite loops, API abuse)
 2) Session Rules compliance
@@ -174,7 +189,9 @@ REQUIRED_FIXES:
 - <actionable fix 2>
 NOTES:
 - <optional>
-"""
+""",
+        ]
+        system_prompt = "".join(sections)
 
         return InjectedPrompt(
             system_prompt=system_prompt,
@@ -200,14 +217,7 @@ NOTES:
         Returns:
             InjectedPrompt
         """
-        rules = self._session_rules
-        if rules is None:
-            from src.control.rules import SessionRules
-            rules = SessionRules(
-                session_id="default",
-                mode="dev",
-                risk_profile="normal"
-            )
+        rules = self._resolve_rules()
 
         agents_list = "\n".join([f"- {a['name']}: {a['description']}" for a in available_agents])
 
@@ -4,9 +4,23 @@ CEO 완성본 - JSONL 감사 로깅
 """
 from __future__ import annotations
 import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, TextIO
+
+# orjson (Rust 구현) 있으면 사용 - 직렬화 5~10배 빠름
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Dict[str, Any]) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
 
 
 class AuditLogger:
@@ -14,9 +28,36 @@ class AuditLogger:
         self.out_dir = Path(out_dir)
         self.out_dir.mkdir(parents=True, exist_ok=True)
         self.fp = self.out_dir / "events.jsonl"
+        # 이벤트마다 open/close 하지 않도록 핸들을 유지 (라인 버퍼링)
+        self._file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+    def _ensure_open(self) -> TextIO:
+        if self._file is None or self._file.closed:
+            self._file = self.fp.open("a", encoding="utf-8", buffering=1)
+        return self._file
 
     def write_event(self, event: Dict[str, Any]) -> None:
         ts = datetime.now(timezone.utc).isoformat()
-        line = json.dumps({"ts": ts, **event}, ensure_ascii=False)
-        with self.fp.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        line = _dumps({"ts": ts, **event})
+        with self._lock:
+            self._ensure_open().write(line + "\n")
+
+    def flush(self) -> None:
+        """버퍼 강제 플러시"""
+        with self._lock:
+            if self._file is not None and not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        """핸들 닫기 (이후 write_event 시 자동 재오픈)"""
+        with self._lock:
+            if self._file is not None and not self._file.closed:
+                self._file.close()
+            self._file = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
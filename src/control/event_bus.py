@@ -3,9 +3,12 @@ Hattz Empire - Event Bus
 CEO 완성본 - 이벤트 발행 + Audit 연동
 """
 from __future__ import annotations
+import logging
 from typing import Dict, Any
 from .audit_log import AuditLogger
 
+logger = logging.getLogger(__name__)
+
 
 class EventBus:
     def __init__(self, logger: AuditLogger = None):
@@ -13,4 +16,6 @@ class EventBus:
 
     def emit(self, kind: str, payload: Dict[str, Any]) -> None:
         self.logger.write_event({"kind": kind, "payload": payload})
-        print(f"[EventBus] {kind}: {payload.get('session_id', 'N/A')}")
+        # 핫 패스 동기 print 제거 — 레벨이 꺼져 있으면 포맷 비용도 없음 (lazy %s)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[EventBus] %s: %s", kind, payload.get("session_id", "N/A"))
@@ -14,10 +14,45 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Union
 
+# orjson (Rust 구현) 있으면 사용 - 파싱 5~10배 빠름
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data: Union[str, bytes]) -> Dict[str, Any]:
+    """가능하면 orjson, 아니면 stdlib json으로 파싱 (str/bytes 모두 허용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 문자열/주석을 한 번의 스캔으로 토큰화
+# 문자열 대안이 먼저 매칭되므로 문자열 내부의 "//"나 "/*"는 주석으로 오인되지 않음
+_JSONC_TOKEN_RE = re.compile(
+    r'"(?:\\.|[^"\\])*"'      # 큰따옴표 문자열
+    r"|'(?:\\.|[^'\\])*'"     # 작은따옴표 문자열
+    r'|/\*.*?\*/'             # 블록 주석
+    r'|/\*.*'                 # 닫히지 않은 블록 주석 (EOF까지 제거)
+    r'|//[^\n]*',             # 라인 주석 (개행은 유지)
+    re.DOTALL,
+)
+
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+
+def _strip_token(match: "re.Match[str]") -> str:
+    token = match.group(0)
+    if token[0] in '"\'':
+        return token  # 문자열은 그대로 유지
+    return ''  # 주석 제거
+
 
 def strip_jsonc_comments(text: str) -> str:
     """
-    JSONC 텍스트에서 주석 제거
+    JSONC 텍스트에서 주석 제거 (단일 패스 정규식 토크나이저)
 
     지원:
     - // 라인 주석
@@ -30,60 +65,15 @@ def strip_jsonc_comments(text: str) -> str:
     Returns:
         순수 JSON 텍스트
     """
-    result = []
-    i = 0
-    in_string = False
-    string_char = None
-
-    while i < len(text):
-        # 문자열 내부 체크
-        if not in_string and text[i] in ('"', "'"):
-            in_string = True
-            string_char = text[i]
-            result.append(text[i])
-            i += 1
-            continue
-
-        if in_string:
-            # 이스케이프 문자 처리
-            if text[i] == '\\' and i + 1 < len(text):
-                result.append(text[i:i+2])
-                i += 2
-                continue
-            # 문자열 종료
-            if text[i] == string_char:
-                in_string = False
-                string_char = None
-            result.append(text[i])
-            i += 1
-            continue
-
-        # 블록 주석 /* */
-        if text[i:i+2] == '/*':
-            end = text.find('*/', i + 2)
-            if end == -1:
-                break  # 주석이 닫히지 않음
-            i = end + 2
-            continue
-
-        # 라인 주석 //
-        if text[i:i+2] == '//':
-            end = text.find('\n', i + 2)
-            if end == -1:
-                break  # 파일 끝
-            i = end + 1
-            result.append('\n')
-            continue
-
-        result.append(text[i])
-        i += 1
-
-    json_text = ''.join(result)
+    # fast path: 주석 토큰 자체가 없으면 토크나이저를 건너뜀
+    # (순수 JSON 입력이 대부분 — "//"/"/*" 유무는 C 레벨 substring 검색)
+    if '/' not in text:
+        json_text = text
+    else:
+        json_text = _JSONC_TOKEN_RE.sub(_strip_token, text)
 
     # 후행 쉼표 제거 (,] 또는 ,})
-    json_text = re.sub(r',\s*([}\]])', r'\1', json_text)
-
-    return json_text
+    return _TRAILING_COMMA_RE.sub(r'\1', json_text)
 
 
 def load_jsonc(file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -105,10 +95,11 @@ def load_jsonc(file_path: Union[str, Path]) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"JSONC file not found: {path}")
 
-    text = path.read_text(encoding='utf-8')
-    clean_json = strip_jsonc_comments(text)
+    # read_text 대신 read_bytes (newline 변환/인코딩 탐지 오버헤드 없음)
+    raw = path.read_bytes()
+    clean_json = strip_jsonc_comments(raw.decode('utf-8'))
 
-    return json.loads(clean_json)
+    return _loads(clean_json)
 
 
 def loads_jsonc(text: str) -> Dict[str, Any]:
@@ -122,7 +113,7 @@ def loads_jsonc(text: str) -> Dict[str, Any]:
         파싱된 딕셔너리
     """
     clean_json = strip_jsonc_comments(text)
-    return json.loads(clean_json)
+    return _loads(clean_json)
 
 
 # =============================================================================
@@ -158,12 +149,15 @@ class JsoncRulesStore:
             base_dir: 규정 파일 디렉토리
         """
         self.base_dir = Path(base_dir)
+        # session_id → (경로, mtime_ns, SessionRules) - 파일 변경 시 자동 무효화
+        self._cache: Dict[str, tuple] = {}
 
     def load(self, session_id: str) -> "SessionRules":
         """
         Session Rules 로드
 
         .jsonc 우선, 없으면 .json 시도
+        (mtime 기반 캐시 - 같은 파일이면 재파싱하지 않음)
 
         Args:
             session_id: 세션 ID
@@ -179,13 +173,25 @@ class JsoncRulesStore:
         # .jsonc 우선
         jsonc_path = self.base_dir / f"{session_id}.jsonc"
         if jsonc_path.exists():
-            return load_session_rules_jsonc(jsonc_path)
+            mtime_ns = jsonc_path.stat().st_mtime_ns
+            cached = self._cache.get(session_id)
+            if cached is not None and cached[0] == jsonc_path and cached[1] == mtime_ns:
+                return cached[2]
+            rules = load_session_rules_jsonc(jsonc_path)
+            self._cache[session_id] = (jsonc_path, mtime_ns, rules)
+            return rules
 
         # .json 시도
         json_path = self.base_dir / f"{session_id}.json"
         if json_path.exists():
-            data = json.loads(json_path.read_text(encoding='utf-8'))
-            return SessionRules(**data)
+            mtime_ns = json_path.stat().st_mtime_ns
+            cached = self._cache.get(session_id)
+            if cached is not None and cached[0] == json_path and cached[1] == mtime_ns:
+                return cached[2]
+            data = _loads(json_path.read_bytes())
+            rules = SessionRules(**data)
+            self._cache[session_id] = (json_path, mtime_ns, rules)
+            return rules
 
         raise FileNotFoundError(
             f"Session rules not found: {session_id} "
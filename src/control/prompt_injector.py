@@ -4,6 +4,9 @@ CEO 완성본 - Worker/Reviewer에 SESSION CONTEXT 주입
 """
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
+from string import Template
+from typing import Dict
 from .constitution import CONSTITUTION_V1
 from .rules import SessionRules
 
@@ -27,35 +30,30 @@ def build_injected_context(session_rules: SessionRules) -> InjectedContext:
     )
 
 
-def make_reviewer_prompt(
-    ctx: InjectedContext,
-    task: str,
-    worker_output: str,
-    diff_summary: str = "",
-    test_results: str = "",
-    static_gate_report: str = "",
-) -> str:
-    return f"""\
-{ctx.constitution}
+# 리뷰어 프롬프트 템플릿 (string.Template)
+# 컨텍스트 고정 필드($constitution 등)는 ctx당 1회 부분 평가하고,
+# 호출마다 바뀌는 필드($task 등)만 매번 치환한다.
+_REVIEWER_TEMPLATE = Template("""\
+$constitution
 
 [SESSION RULES JSON]
-{ctx.session_rules_json}
+$session_rules_json
 
 [STATIC GATE REPORT]
-{static_gate_report}
+$static_gate_report
 
 [ROLE]
 You are the Reviewer/Gatekeeper. Enforce Constitution + Session Rules.
 If any violation exists, output REJECT.
 
 [INPUTS]
-- Session ID: {ctx.session_id}
-- Rules Hash: {ctx.rules_hash}
-- Rule Version: {ctx.rule_version}
-- Task: {task}
-- Worker Output: {worker_output}
-- Diff/Files Changed: {diff_summary}
-- Test Results: {test_results}
+- Session ID: $session_id
+- Rules Hash: $rules_hash
+- Rule Version: $rule_version
+- Task: $task
+- Worker Output: $worker_output
+- Diff/Files Changed: $diff_summary
+- Test Results: $test_results
 
 [CHECK ORDER]
 1) Safety/Integrity (secrets, live-trade risk, infinite loops, API abuse)
@@ -71,17 +69,55 @@ REQUIRED_FIXES:
 - <actionable fix 2>
 NOTES:
 - <optional>
-"""
+""")
+
+
+@lru_cache(maxsize=16)
+def _reviewer_template_for(ctx: InjectedContext) -> Template:
+    """ctx 고정 필드를 미리 치환한 부분 평가 템플릿 (ctx당 1회)"""
+    return Template(_REVIEWER_TEMPLATE.safe_substitute(
+        constitution=ctx.constitution,
+        session_rules_json=ctx.session_rules_json,
+        session_id=ctx.session_id,
+        rules_hash=ctx.rules_hash,
+        rule_version=ctx.rule_version,
+    ))
+
+
+def make_reviewer_prompt(
+    ctx: InjectedContext,
+    task: str,
+    worker_output: str,
+    diff_summary: str = "",
+    test_results: str = "",
+    static_gate_report: str = "",
+) -> str:
+    return _reviewer_template_for(ctx).safe_substitute(
+        static_gate_report=static_gate_report,
+        task=task,
+        worker_output=worker_output,
+        diff_summary=diff_summary,
+        test_results=test_results,
+    )
+
+
+# rules_hash → 완성된 worker 컨텍스트 (규정이 같으면 문자열 재사용)
+_worker_context_cache: Dict[str, str] = {}
 
 
 def make_worker_context(session_rules: SessionRules) -> str:
-    """Worker에게 주입할 간단한 컨텍스트"""
-    return f"""\
+    """Worker에게 주입할 간단한 컨텍스트 (rules_hash 기준 메모이즈)"""
+    cache_key = session_rules.rules_hash()
+    cached = _worker_context_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    context = f"""\
 [SESSION CONTEXT]
 - Session ID: {session_rules.session_id}
 - Mode: {session_rules.mode}
 - Risk Profile: {session_rules.risk_profile}
-- Rules Hash: {session_rules.rules_hash()}
+- Rules Hash: {cache_key}
 
 [RULES SUMMARY]
 - Secrets Hardcoding: {session_rules.rules.code.secrets_hardcoding}
@@ -91,3 +127,5 @@ def make_worker_context(session_rules: SessionRules) -> str:
 
 위 규칙을 준수하여 작업하세요.
 """
+    _worker_context_cache[cache_key] = context
+    return context
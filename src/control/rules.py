@@ -6,7 +6,14 @@ from __future__ import annotations
 import json
 import hashlib
 from typing import Literal, Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+# orjson (Rust 구현) 있으면 사용 - 직렬화 5~10배 빠름
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 Mode = Literal["dev"]
 RiskProfile = Literal["normal"]
@@ -38,8 +45,30 @@ class SessionRules(BaseModel):
     rules: RulesBlock = Field(default_factory=RulesBlock)
     overrides: List[str] = Field(default_factory=list)
 
+    # 규정은 로드 후 불변으로 취급 → 직렬화/해시 결과를 1회 계산 후 재사용
+    _canonical_cache: Optional[str] = PrivateAttr(default=None)
+    _hash_cache: Optional[str] = PrivateAttr(default=None)
+
     def canonical_json(self) -> str:
-        return json.dumps(self.model_dump(), ensure_ascii=False, sort_keys=True)
+        if self._canonical_cache is None:
+            data = self.model_dump()
+            if ORJSON_AVAILABLE:
+                self._canonical_cache = orjson.dumps(
+                    data, option=orjson.OPT_SORT_KEYS
+                ).decode("utf-8")
+            else:
+                # orjson의 compact 포맷과 바이트 단위로 동일하게 유지
+                # (rules_hash가 설치 여부와 무관하게 결정적이어야 함)
+                self._canonical_cache = json.dumps(
+                    data, ensure_ascii=False, sort_keys=True,
+                    separators=(",", ":")
+                )
+        return self._canonical_cache
 
     def rules_hash(self) -> str:
-        return hashlib.sha256(self.canonical_json().encode("utf-8")).hexdigest()
+        # blake2b(16바이트)는 sha256보다 빠르고, 규정 식별용으로는 충분한 강도
+        if self._hash_cache is None:
+            self._hash_cache = hashlib.blake2b(
+                self.canonical_json().encode("utf-8"), digest_size=16
+            ).hexdigest()
+        return self._hash_cache
@@ -5,19 +5,30 @@ Hattz Empire - Rules Store
 from __future__ import annotations
 import json
 from pathlib import Path
+from typing import Dict, Tuple
 from .rules import SessionRules
 
 
 class RulesStore:
     def __init__(self, base_dir: str = "config/session_rules"):
         self.base_dir = Path(base_dir)
+        # session_id → (mtime_ns, SessionRules) - 파일 변경 시 자동 무효화
+        self._cache: Dict[str, Tuple[int, SessionRules]] = {}
 
     def load(self, session_id: str) -> SessionRules:
         fp = self.base_dir / f"{session_id}.json"
         if not fp.exists():
             raise FileNotFoundError(f"Session rules not found: {fp}")
-        data = json.loads(fp.read_text(encoding="utf-8"))
-        return SessionRules(**data)
+
+        mtime_ns = fp.stat().st_mtime_ns
+        cached = self._cache.get(session_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        data = json.loads(fp.read_bytes())
+        rules = SessionRules(**data)
+        self._cache[session_id] = (mtime_ns, rules)
+        return rules
 
     def exists(self, session_id: str) -> bool:
         fp = self.base_dir / f"{session_id}.json"
@@ -10,11 +10,11 @@ from __future__ import annotations
 import ast
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Iterable
+from typing import List, Optional
 from .rules import CodeRules
 
 
-@dataclass
+@dataclass(slots=True)
 class StaticViolation:
     key: str
     detail: str
@@ -34,19 +34,86 @@ _SECRET_PATTERNS = [
     r"secret[_-]?key\s*[=:]\s*['\"][^'\"]{8,}['\"]",  # SECRET_KEY=...
 ]
 
+# 패턴별 개별 스캔 대신 단일 alternation으로 합쳐 한 번만 컴파일
+# → 텍스트 1회 순회로 전 패턴 동시 매칭 (DFA 스타일 멀티패턴 스캔)
+_SECRET_RE = re.compile("|".join(f"(?:{p})" for p in _SECRET_PATTERNS))
 
-def _regex_hits(patterns: Iterable[str], text: str, max_hits: int = 5) -> List[str]:
+
+def _regex_hits(pattern: "re.Pattern[str]", text: str, max_hits: int = 5) -> List[str]:
     hits: List[str] = []
-    for pat in patterns:
-        for m in re.finditer(pat, text):
-            start = max(0, m.start() - 40)
-            end = min(len(text), m.end() + 40)
-            hits.append(text[start:end].replace("\n", "\\n"))
-            if len(hits) >= max_hits:
-                return hits
+    for m in pattern.finditer(text):
+        start = max(0, m.start() - 40)
+        end = min(len(text), m.end() + 40)
+        hits.append(text[start:end].replace("\n", "\\n"))
+        if len(hits) >= max_hits:
+            return hits
     return hits
 
 
+class _LoopScanner(ast.NodeVisitor):
+    """루프 관련 증거를 단일 DFS로 수집하는 방문자"""
+
+    def __init__(self):
+        self.sleep_ev: Optional[str] = None
+        self.infloop_ev: Optional[str] = None
+        self._loop_stack: list = []        # 둘러싼 For/While 노드들
+        self._while_true_stack: list = []  # [node, has_exit] 엔트리들
+
+    @staticmethod
+    def _is_sleep_call(call: ast.Call) -> bool:
+        fn = call.func
+        if isinstance(fn, ast.Attribute):
+            return fn.attr == "sleep"
+        if isinstance(fn, ast.Name):
+            return fn.id == "sleep"
+        return False
+
+    def _visit_loop(self, node, is_while_true: bool) -> None:
+        self._loop_stack.append(node)
+        entry = [node, False]
+        if is_while_true:
+            self._while_true_stack.append(entry)
+
+        self.generic_visit(node)
+
+        self._loop_stack.pop()
+        if is_while_true:
+            self._while_true_stack.pop()
+            if not entry[1] and self.infloop_ev is None:
+                self.infloop_ev = f"while_true@line={getattr(node, 'lineno', '?')}"
+
+    def visit_For(self, node: ast.For) -> None:
+        self._visit_loop(node, is_while_true=False)
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
+        self._visit_loop(node, is_while_true=False)
+
+    def visit_While(self, node: ast.While) -> None:
+        is_while_true = isinstance(node.test, ast.Constant) and node.test.value is True
+        self._visit_loop(node, is_while_true)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if self.sleep_ev is None and self._loop_stack and self._is_sleep_call(node):
+            outer = self._loop_stack[0]
+            self.sleep_ev = (
+                f"loop@line={getattr(outer, 'lineno', '?')}, "
+                f"sleep@line={getattr(node, 'lineno', '?')}"
+            )
+        self.generic_visit(node)
+
+    def _mark_exit(self) -> None:
+        # break/return은 둘러싼 모든 while True의 탈출구로 간주
+        for entry in self._while_true_stack:
+            entry[1] = True
+
+    def visit_Break(self, node: ast.Break) -> None:
+        self._mark_exit()
+
+    def visit_Return(self, node: ast.Return) -> None:
+        self._mark_exit()
+        self.generic_visit(node)
+
+
 class StaticChecker:
     def __init__(self, rules: CodeRules):
         self.rules = rules
@@ -56,7 +123,7 @@ class StaticChecker:
 
         # 1) 시크릿 하드코딩 검사
         if self.rules.secrets_hardcoding == "forbid":
-            hits = _regex_hits(_SECRET_PATTERNS, code)
+            hits = _regex_hits(_SECRET_RE, code)
             for h in hits:
                 v.append(StaticViolation(
                     key="code.secrets_hardcoding",
@@ -64,59 +131,43 @@ class StaticChecker:
                     evidence=h
                 ))
 
-        # 2) 루프 안 sleep 검사
-        if self.rules.forbid_sleep_in_api_loop:
-            ev = self._sleep_in_loop_evidence(code)
-            if ev:
+        # 2+3) 루프 안 sleep + 무한루프 검사 (단일 AST 순회로 융합)
+        if self.rules.forbid_sleep_in_api_loop or self.rules.forbid_infinite_loop:
+            sleep_ev, infloop_ev = self._loop_evidence(code)
+
+            if self.rules.forbid_sleep_in_api_loop and sleep_ev:
                 v.append(StaticViolation(
                     key="code.forbid_sleep_in_api_loop",
                     detail="sleep() detected inside a loop (blocking risk in hot loops).",
-                    evidence=ev
+                    evidence=sleep_ev
                 ))
 
-        # 3) 무한루프 검사
-        if self.rules.forbid_infinite_loop:
-            ev = self._infinite_loop_evidence(code)
-            if ev:
+            if self.rules.forbid_infinite_loop and infloop_ev:
                 v.append(StaticViolation(
                     key="code.forbid_infinite_loop",
                     detail="Possible infinite loop: while True without break/return nearby.",
-                    evidence=ev
+                    evidence=infloop_ev
                 ))
 
         return v
 
-    def _sleep_in_loop_evidence(self, code: str) -> Optional[str]:
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
-            return None
-
-        def is_sleep_call(call: ast.Call) -> bool:
-            fn = call.func
-            if isinstance(fn, ast.Attribute):
-                return fn.attr == "sleep"
-            if isinstance(fn, ast.Name):
-                return fn.id == "sleep"
-            return False
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.For, ast.While)):
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Call) and is_sleep_call(child):
-                        return f"loop@line={getattr(node, 'lineno', '?')}, sleep@line={getattr(child, 'lineno', '?')}"
-        return None
-
-    def _infinite_loop_evidence(self, code: str) -> Optional[str]:
+    def _loop_evidence(self, code: str) -> tuple[Optional[str], Optional[str]]:
+        """
+        한 번의 파싱 + 순회로 두 가지 증거 수집:
+        - 루프 내부 sleep() 호출
+        - break/return 없는 while True
+
+        노드당 정확히 1회 방문 (루프마다 서브트리를 ast.walk로 재순회하던
+        O(N^2) 패턴 제거 — 둘러싼 루프는 스택으로 추적)
+
+        Returns:
+            (sleep_evidence, infinite_loop_evidence)
+        """
         try:
             tree = ast.parse(code)
         except SyntaxError:
-            return None
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.While) and isinstance(node.test, ast.Constant) and node.test.value is True:
-                has_break = any(isinstance(ch, ast.Break) for ch in ast.walk(node))
-                has_return = any(isinstance(ch, ast.Return) for ch in ast.walk(node))
-                if not has_break and not has_return:
-                    return f"while_true@line={getattr(node, 'lineno', '?')}"
-        return None
+            return None, None
+
+        scanner = _LoopScanner()
+        scanner.visit(tree)
+        return scanner.sleep_ev, scanner.infloop_ev
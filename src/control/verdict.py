@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class Violation:
     key: str
     detail: str
@@ -25,18 +25,27 @@ class ReviewVerdict:
 _VERDICT_RE = re.compile(r"^VERDICT:\s*(PASS|REJECT)\s*$", re.MULTILINE)
 
 
+def _section_re(header: str) -> "re.Pattern[str]":
+    return re.compile(rf"{header}:\s*(.*?)(?:\n[A-Z_ ]+:\s*|$)", re.DOTALL)
+
+
+# 섹션 패턴은 고정 → 호출마다 rf-string 조립/컴파일하지 않고 모듈 로드 시 1회 컴파일
+_VIOLATIONS_RE = _section_re("VIOLATIONS")
+_REQUIRED_FIXES_RE = _section_re("REQUIRED_FIXES")
+_NOTES_RE = _section_re("NOTES")
+
+
 def parse_reviewer_output(text: str) -> ReviewVerdict:
     m = _VERDICT_RE.search(text)
     verdict = m.group(1) if m else "REJECT"
 
-    def extract_section(header: str) -> str:
-        pattern = rf"{header}:\s*(.*?)(?:\n[A-Z_ ]+:\s*|$)"
-        mm = re.search(pattern, text, flags=re.DOTALL)
+    def extract_section(pattern: "re.Pattern[str]") -> str:
+        mm = pattern.search(text)
         return (mm.group(1).strip() if mm else "")
 
-    violations_block = extract_section("VIOLATIONS")
-    fixes_block = extract_section("REQUIRED_FIXES")
-    notes_block = extract_section("NOTES")
+    violations_block = extract_section(_VIOLATIONS_RE)
+    fixes_block = extract_section(_REQUIRED_FIXES_RE)
+    notes_block = extract_section(_NOTES_RE)
 
     violations: List[Violation] = []
     for line in [ln.strip("- ").strip() for ln in violations_block.splitlines() if ln.strip()]:
@@ -8,12 +8,27 @@ LLM 출력 형식 강제 + 형식 게이트
 - 파싱 실패 = 즉시 재시도 (PM까지 안 감)
 - "응답 형식 오류"라는 말 자체가 사라져야 함
 """
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from typing import List, Optional, Literal, Union
 from enum import Enum
+from functools import lru_cache
 import json
 import re
 
+# orjson (Rust 구현) 있으면 사용 - 직렬화 5~10배 빠름
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_indent(data) -> str:
+    """들여쓰기 JSON 직렬화 (가능하면 orjson)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
 
 # =============================================================================
 # Verdict Enums
@@ -42,15 +57,19 @@ class CoderOutput(BaseModel):
     diff: str = Field(..., description="unified diff 형식")
     todo_next: Optional[str] = Field(None, description="다음 단계 힌트 (선택)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        validate_default=False,
+        revalidate_instances='never',
+        json_schema_extra={
             "example": {
                 "summary": "로그인 API 버그 수정",
                 "files_changed": ["src/api/auth.py"],
                 "diff": "--- a/src/api/auth.py\n+++ b/src/api/auth.py\n@@ -10,3 +10,4 @@\n+    return jsonify({'ok': True})",
                 "todo_next": None
             }
-        }
+        },
+    )
 
 
 # =============================================================================
@@ -71,8 +90,11 @@ class QAOutput(BaseModel):
     coverage_summary: Optional[str] = Field(None, description="커버리지 요약")
     issues_found: List[str] = Field(default_factory=list, description="발견된 이슈 목록")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        validate_default=False,
+        revalidate_instances='never',
+        json_schema_extra={
             "example": {
                 "verdict": "PASS",
                 "tests": [
@@ -82,7 +104,8 @@ class QAOutput(BaseModel):
                 "coverage_summary": "85% (34/40 lines)",
                 "issues_found": []
             }
-        }
+        },
+    )
 
 
 # =============================================================================
@@ -106,8 +129,11 @@ class ReviewerOutput(BaseModel):
     approved_files: List[str] = Field(default_factory=list)
     blocked_files: List[str] = Field(default_factory=list)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        validate_default=False,
+        revalidate_instances='never',
+        json_schema_extra={
             "example": {
                 "verdict": "APPROVE",
                 "risks": [],
@@ -115,7 +141,8 @@ class ReviewerOutput(BaseModel):
                 "approved_files": ["src/api/auth.py"],
                 "blocked_files": []
             }
-        }
+        },
+    )
 
 
 # =============================================================================
@@ -138,8 +165,11 @@ class StrategistOutput(BaseModel):
     recommendation: str = Field(..., description="추천 옵션 이름")
     reasoning: str = Field(..., description="추천 이유, 3문장 이내")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        validate_default=False,
+        revalidate_instances='never',
+        json_schema_extra={
             "example": {
                 "problem_summary": "인증 시스템 리팩토링 필요",
                 "options": [
@@ -149,7 +179,8 @@ class StrategistOutput(BaseModel):
                 "recommendation": "JWT 도입",
                 "reasoning": "확장성이 중요하므로 JWT를 추천합니다."
             }
-        }
+        },
+    )
 
 
 # =============================================================================
@@ -186,8 +217,11 @@ class PMOutput(BaseModel):
             return v[:297] + "..."
         return v
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        validate_default=False,
+        revalidate_instances='never',
+        json_schema_extra={
             "example": {
                 "action": "DISPATCH",
                 "tasks": [
@@ -196,7 +230,8 @@ class PMOutput(BaseModel):
                 "summary": "coder에게 로그인 버그 수정 할당",
                 "requires_ceo": False
             }
-        }
+        },
+    )
 
 
 # =============================================================================
@@ -223,8 +258,11 @@ class DocumentorOutput(BaseModel):
     files_affected: List[str] = Field(..., description="영향받은 파일 목록")
     breaking_change: bool = Field(False, description="하위 호환성 깨지는 변경인지")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        validate_default=False,
+        revalidate_instances='never',
+        json_schema_extra={
             "example": {
                 "commit_type": "feat",
                 "commit_message": "Add FormatGate to enforce output contracts",
@@ -232,7 +270,8 @@ class DocumentorOutput(BaseModel):
                 "files_affected": ["src/core/contracts.py", "src/core/llm_caller.py"],
                 "breaking_change": False
             }
-        }
+        },
+    )
 
 
 # =============================================================================
@@ -250,19 +289,119 @@ CONTRACT_REGISTRY = {
 }
 
 
+# 역할별 TypeAdapter (컴파일된 core validator 직접 호출 - BaseModel 디스패치 생략)
+# 역할별 TypeAdapter - import 시 1회 빌드 (호출마다 스키마 재해석 금지)
+# validate_output/run_with_contract는 validate_json으로 단일 파싱 경로 사용.
+# 계약에 Union 타입이 생기면 discriminator 지정 필수 (검증 셋업 비용 폭증 방지).
+_ADAPTERS = {role: TypeAdapter(cls) for role, cls in CONTRACT_REGISTRY.items()}
+
+# 역할별 리스트 TypeAdapter (배치 검증용 - validator 셋업/디스패치 비용 상각)
+_LIST_ADAPTERS = {role: TypeAdapter(List[cls]) for role, cls in CONTRACT_REGISTRY.items()}
+
+
+def _example_payload(contract: type[BaseModel]) -> dict:
+    """계약 클래스의 스키마 예시 payload 반환 (없으면 {})"""
+    extra = contract.model_config.get("json_schema_extra")
+    return extra.get("example", {}) if isinstance(extra, dict) else {}
+
+
+def _pick_trusted_builder(contract: type[BaseModel]):
+    """
+    신뢰된(이미 검증된) dict 재구성용 빌더 선택
+
+    model_construct는 검증을 건너뛰지만 중첩 모델을 coerce하지 않으므로,
+    스키마 예시로 round-trip 결과가 전체 검증과 동일할 때만 채택.
+    작은 모델에서는 model_construct가 오히려 느릴 수 있어 1회 비교 측정.
+    """
+    import time as _time
+
+    example = _example_payload(contract)
+    if not example:
+        return contract.model_validate
+
+    validate = contract.model_validate
+    construct = contract.model_construct
+
+    try:
+        if construct(**example) != validate(example):
+            # 중첩 모델 coerce 필요 → 전체 검증 경로 유지
+            return validate
+    except Exception:
+        return validate
+
+    def _bench(fn, kwargs: bool) -> float:
+        start = _time.perf_counter()
+        for _ in range(50):
+            fn(**example) if kwargs else fn(example)
+        return _time.perf_counter() - start
+
+    construct_time = _bench(construct, kwargs=True)
+    validate_time = _bench(validate, kwargs=False)
+    return construct if construct_time < validate_time else validate
+
+
+# 역할별 신뢰 빌더 (검증 생략 가능 여부를 import 시 1회 판정)
+_TRUSTED_BUILDERS = {
+    role: _pick_trusted_builder(cls) for role, cls in CONTRACT_REGISTRY.items()
+}
+
+
+def construct_trusted(agent_role: str, data: dict) -> Optional[BaseModel]:
+    """
+    이미 검증을 통과한 dict에서 계약 인스턴스 재구성
+
+    model_dump() round-trip 등 신뢰된 경로 전용. 계약별로 model_construct가
+    안전하고 더 빠를 때만 검증을 생략한다.
+    """
+    builder = _TRUSTED_BUILDERS.get(agent_role)
+    if builder is None:
+        return None
+    if builder.__name__ == "model_construct":
+        return builder(**data)
+    return builder(data)
+
+
+def _warmup_contracts() -> None:
+    """
+    import 시 계약 검증기 워밍업
+
+    Pydantic v2는 첫 검증 시점까지 일부 컴파일을 미루므로, 스키마 예시로
+    각 계약을 1회 검증해 첫 실제 LLM 호출의 콜드스타트 스파이크 제거
+    """
+    for role, cls in CONTRACT_REGISTRY.items():
+        example = _example_payload(cls)
+        if not example:
+            continue
+        try:
+            _ADAPTERS[role].validate_python(example)
+            _LIST_ADAPTERS[role].validate_python([example])
+        except Exception:
+            # 워밍업 실패는 무시 (실호출 경로에서 정상 에러 처리)
+            pass
+
+
+_warmup_contracts()
+
+
 def get_contract(agent_role: str) -> type[BaseModel]:
     """에이전트 역할에 맞는 계약 반환"""
     return CONTRACT_REGISTRY.get(agent_role)
 
 
+@lru_cache(maxsize=None)
 def get_schema_prompt(agent_role: str) -> str:
-    """에이전트에게 주입할 스키마 프롬프트 생성"""
+    """
+    에이전트에게 주입할 스키마 프롬프트 생성
+
+    역할별 스키마는 정적이므로 최초 1회만 렌더링하고 캐시
+    (매 LLM 호출마다 model_json_schema() + json.dumps 재실행 방지)
+    """
     contract = get_contract(agent_role)
     if not contract:
         return ""
 
     schema = contract.model_json_schema()
-    example = contract.Config.json_schema_extra.get("example", {}) if hasattr(contract.Config, "json_schema_extra") else {}
+    example = _example_payload(contract)
 
     return f"""## 출력 형식 (필수)
 
@@ -271,12 +410,12 @@ def get_schema_prompt(agent_role: str) -> str:
 
 ### 스키마
 ```json
-{json.dumps(schema, ensure_ascii=False, indent=2)}
+{_dumps_indent(schema)}
 ```
 
 ### 예시
 ```json
-{json.dumps(example, ensure_ascii=False, indent=2)}
+{_dumps_indent(example)}
 ```
 
 규칙:
@@ -290,17 +429,72 @@ def get_schema_prompt(agent_role: str) -> str:
 # Format Gate (핵심)
 # =============================================================================
 
-def extract_json_from_output(raw: str) -> str:
-    """LLM 출력에서 JSON 부분만 추출"""
+# 모듈 레벨 사전 컴파일 (매 게이트 시도마다 re 캐시 조회 방지)
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+_JSON_BLOCK_RE_B = re.compile(rb'```json\s*(.*?)\s*```', re.DOTALL)
+
+# str/bytes 겸용 출력 타입
+RawOutput = Union[str, bytes]
+
+
+def _scan_json_object(raw: RawOutput) -> Optional[RawOutput]:
+    """
+    첫 '{'부터 균형 잡힌 '}'까지 단일 패스 스캔
+
+    정규식 백트래킹 없이 O(n) - 긴 코더/애널리스트 출력에서도 선형 시간.
+    문자열 리터럴 내부의 중괄호/이스케이프는 건너뜀.
+    str/bytes 모두 지원 (bytes는 디코딩 없이 그대로 스캔).
+    """
+    if isinstance(raw, bytes):
+        lbrace, rbrace, quote, backslash = 0x7B, 0x7D, 0x22, 0x5C  # { } " \
+        start = raw.find(b'{')
+    else:
+        lbrace, rbrace, quote, backslash = '{', '}', '"', '\\'
+        start = raw.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(raw)):
+        ch = raw[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == backslash:
+                escape = True
+            elif ch == quote:
+                in_string = False
+        elif ch == quote:
+            in_string = True
+        elif ch == lbrace:
+            depth += 1
+        elif ch == rbrace:
+            depth -= 1
+            if depth == 0:
+                return raw[start:i + 1]
+
+    return None
+
+
+def extract_json_from_output(raw: RawOutput) -> RawOutput:
+    """
+    LLM 출력에서 JSON 부분만 추출
+
+    bytes 입력은 디코딩 없이 bytes로 반환 - pydantic-core가 bytes를
+    직접 받으므로 str 변환 + 재인코딩 복사를 생략할 수 있다.
+    """
     # 1. ```json ... ``` 블록 찾기
-    json_block = re.search(r'```json\s*([\s\S]*?)\s*```', raw)
+    block_re = _JSON_BLOCK_RE_B if isinstance(raw, bytes) else _JSON_BLOCK_RE
+    json_block = block_re.search(raw)
     if json_block:
         return json_block.group(1).strip()
 
-    # 2. { ... } 찾기
-    brace_match = re.search(r'\{[\s\S]*\}', raw)
-    if brace_match:
-        return brace_match.group(0).strip()
+    # 2. { ... } 찾기 (선형 중괄호 스캐너)
+    obj = _scan_json_object(raw)
+    if obj:
+        return obj
 
     # 3. 그대로 반환
     return raw.strip()
@@ -316,7 +510,7 @@ def run_with_contract(
     형식 게이트: LLM 호출 + 계약 검증
 
     Args:
-        llm_call: LLM 호출 함수 (str 반환)
+        llm_call: LLM 호출 함수 (str 또는 bytes 반환)
         agent_role: 에이전트 역할
         max_retry: 최대 재시도 횟수
         on_retry: 재시도 시 호출할 콜백 (error_msg를 받음)
@@ -327,8 +521,8 @@ def run_with_contract(
     Raises:
         FormatGateError: 최대 재시도 초과 시
     """
-    contract = get_contract(agent_role)
-    if not contract:
+    adapter = _ADAPTERS.get(agent_role)
+    if adapter is None:
         # 계약 없는 에이전트는 raw string 반환
         return llm_call()
 
@@ -337,12 +531,21 @@ def run_with_contract(
     for attempt in range(max_retry):
         raw = llm_call()
 
+        # 명백한 실패(빈/극단적으로 짧은 출력)는 추출/검증 없이 바로 재시도
+        if not raw or len(raw) < 2:
+            last_error = "빈 출력"
+            print(f"[FormatGate] 빈 출력 ({attempt + 1}/{max_retry})")
+            if on_retry:
+                on_retry(last_error)
+            continue
+
         try:
             # JSON 추출
             json_str = extract_json_from_output(raw)
 
-            # Pydantic 검증
-            validated = contract.model_validate_json(json_str)
+            # Pydantic 검증 (TypeAdapter.validate_json - Rust 파서가
+            # JSON을 정확히 1회만 파싱하며 검증까지 수행)
+            validated = adapter.validate_json(json_str)
             return validated
 
         except Exception as e:
@@ -364,25 +567,52 @@ class FormatGateError(Exception):
 # Validation Helper
 # =============================================================================
 
-def validate_output(raw: str, agent_role: str) -> tuple[bool, BaseModel | str, str | None]:
+def validate_output(raw: RawOutput, agent_role: str) -> tuple[bool, BaseModel | RawOutput, str | None]:
     """
     출력 검증 헬퍼
 
     Returns:
         (success, validated_or_raw, error_message)
     """
-    contract = get_contract(agent_role)
-    if not contract:
+    adapter = _ADAPTERS.get(agent_role)
+    if adapter is None:
         return True, raw, None
 
     try:
         json_str = extract_json_from_output(raw)
-        validated = contract.model_validate_json(json_str)
+        validated = adapter.validate_json(json_str)
         return True, validated, None
     except Exception as e:
         return False, raw, str(e)
 
 
+def validate_outputs_batch(
+    raws: List[RawOutput],
+    agent_role: str
+) -> List[tuple[bool, BaseModel | RawOutput, str | None]]:
+    """
+    동일 역할 출력 여러 건 일괄 검증 (병렬 위원회 등)
+
+    전체를 리스트 TypeAdapter로 한 번에 검증해 건당 디스패치 비용을 상각.
+    하나라도 실패하면 개별 검증으로 돌아가 실패 건만 격리한다.
+
+    Returns:
+        입력 순서대로 (success, validated_or_raw, error_message) 리스트
+    """
+    list_adapter = _LIST_ADAPTERS.get(agent_role)
+    if list_adapter is None:
+        return [(True, raw, None) for raw in raws]
+
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    try:
+        parsed = [loads(extract_json_from_output(raw)) for raw in raws]
+        validated = list_adapter.validate_python(parsed)
+        return [(True, v, None) for v in validated]
+    except Exception:
+        # 실패 건 격리 - 건별 검증으로 폴백
+        return [validate_output(raw, agent_role) for raw in raws]
+
+
 # =============================================================================
 # Test
 # =============================================================================
@@ -9,9 +9,18 @@ PM 출력을 시스템 상태 전이로 변환
 """
 from enum import Enum
 from typing import Optional, Dict, Any, List, Tuple
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 
+# pyahocorasick (C 구현) 있으면 사용 - 키워드 매칭 단일 패스 O(n)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 # =============================================================================
 # Decision Enums
@@ -46,6 +55,26 @@ FORBIDDEN_TRANSITIONS = [
     (PMDecision.BLOCKED, PMDecision.DISPATCH),    # BLOCKED는 ESCALATE로만 가능
 ]
 
+# 고정 테이블이므로 O(1) 조회용 메시지 맵을 import 시 1회 생성
+_FORBIDDEN_MSGS: Dict[Tuple[PMDecision, PMDecision], str] = {
+    (a, b): f"{a.value} -> {b.value} 전이 금지" for a, b in FORBIDDEN_TRANSITIONS
+}
+
+
+@lru_cache(maxsize=128)
+def _build_full_text(summary: str, tasks_key: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    에스컬레이션 사유 추론용 전체 텍스트 결합 + 소문자화
+
+    재시도 루프에서 동일한 PM 출력이 반복 처리될 때 join/lower 재실행 방지
+    (tasks_key는 (instruction, context) 쌍 튜플 - 해시 가능)
+    """
+    parts = [summary]
+    for instruction, context in tasks_key:
+        parts.append(instruction)
+        parts.append(context)
+    return " ".join(parts).lower()
+
 
 def is_valid_transition(from_state: PMDecision, to_state: PMDecision) -> bool:
     """전이 유효성 검사"""
@@ -55,9 +84,9 @@ def is_valid_transition(from_state: PMDecision, to_state: PMDecision) -> bool:
 
 def get_forbidden_reason(from_state: PMDecision, to_state: PMDecision) -> Optional[str]:
     """금지된 전이 사유 반환"""
-    for forbidden_from, forbidden_to in FORBIDDEN_TRANSITIONS:
-        if from_state == forbidden_from and to_state == forbidden_to:
-            return f"{from_state.value} -> {to_state.value} 전이 금지"
+    msg = _FORBIDDEN_MSGS.get((from_state, to_state))
+    if msg is not None:
+        return msg
     if to_state not in ALLOWED_TRANSITIONS.get(from_state, set()):
         return f"{from_state.value}에서 {to_state.value}로 전이 불가"
     return None
@@ -92,12 +121,18 @@ class EscalationReason(str, Enum):
 # Decision Output (정형화된 의사결정)
 # =============================================================================
 
-@dataclass
+# enum → 값 문자열 사전 생성 (to_dict 등 핫패스에서 .value 속성 조회 제거)
+_DECISION_VALUES = {d: d.value for d in PMDecision}
+_TARGET_VALUES = {t: t.value for t in DispatchTarget}
+_REASON_VALUES = {r: r.value for r in EscalationReason}
+
+@dataclass(slots=True)
 class DecisionOutput:
     """
     PM Decision Machine 출력
 
     summary는 로그용, decision이 실제 상태 전이
+    (slots=True - PM 턴마다 생성되므로 인스턴스 dict 제거)
     """
     decision: PMDecision
     targets: List[DispatchTarget]           # DISPATCH 시 대상 에이전트들
@@ -107,9 +142,9 @@ class DecisionOutput:
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "decision": self.decision.value,
-            "targets": [t.value for t in self.targets],
-            "escalation_reason": self.escalation_reason.value if self.escalation_reason else None,
+            "decision": _DECISION_VALUES[self.decision],
+            "targets": [_TARGET_VALUES[t] for t in self.targets],
+            "escalation_reason": _REASON_VALUES[self.escalation_reason] if self.escalation_reason else None,
             "summary": self.summary[:100],
             "confidence": self.confidence
         }
@@ -150,6 +185,9 @@ class PMDecisionMachine:
         DispatchTarget.EXCAVATOR: ["요구사항", "requirement", "불명확", "모순", "clarify"],
     }
 
+    # 히트 빈도 기반 키워드 재정렬 주기
+    _RESORT_INTERVAL = 256
+
     # 의미 없는 summary 패턴 (SemanticGuard와 동일)
     NULL_PATTERNS = [
         r"검토했습니다",
@@ -162,9 +200,65 @@ class PMDecisionMachine:
     ]
 
     def __init__(self):
-        self._compiled_null_patterns = [
-            re.compile(p, re.IGNORECASE) for p in self.NULL_PATTERNS
-        ]
+        # action → 핸들러 디스패치 테이블 (if/elif 체인 대신 상수 시간 분기)
+        self._action_dispatch = {
+            "ESCALATE": self._build_escalate_decision,
+            "DISPATCH": self._build_dispatch_decision,
+            "DONE": self._build_done_decision,
+        }
+
+        # 키워드 소문자화는 1회만 (호출마다 inner loop에서 .lower() 방지)
+        self._esc_keywords_lower = {
+            reason: tuple(k.lower() for k in kws)
+            for reason, kws in self.ESCALATION_KEYWORDS.items()
+        }
+        self._agent_keywords_lower = {
+            agent: tuple(k.lower() for k in kws)
+            for agent, kws in self.AGENT_KEYWORDS.items()
+        }
+
+        # 온라인 히트 카운터 - 주기적으로 자주 맞는 키워드를 리스트 앞으로 재배치
+        # (앞쪽 키워드가 먼저 short-circuit되므로 평균 비교 횟수 감소)
+        self._kw_hits: Counter = Counter()
+        self._hits_until_resort = self._RESORT_INTERVAL
+
+        # Aho-Corasick 오토마톤 (1회 구축) - 키워드 수와 무관하게 텍스트 단일 스캔
+        self._esc_automaton = None
+        self._agent_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._esc_automaton = self._build_automaton(self.ESCALATION_KEYWORDS)
+            self._agent_automaton = self._build_automaton(self.AGENT_KEYWORDS)
+
+    @staticmethod
+    def _build_automaton(keyword_map: Dict) -> "ahocorasick.Automaton":
+        """키워드 테이블 → Aho-Corasick 오토마톤"""
+        automaton = ahocorasick.Automaton()
+        for owner, keywords in keyword_map.items():
+            for kw in keywords:
+                automaton.add_word(kw.lower(), (kw.lower(), owner))
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _scan_matches(automaton: "ahocorasick.Automaton", text_lower: str) -> set:
+        """텍스트 단일 스캔 → 매칭된 (키워드, 소유자) 집합"""
+        return {value for _, value in automaton.iter(text_lower)}
+
+    def _record_hit(self, keyword: str) -> None:
+        """키워드 히트 기록 - 주기마다 빈도순으로 테이블 재정렬"""
+        self._kw_hits[keyword] += 1
+        self._hits_until_resort -= 1
+        if self._hits_until_resort <= 0:
+            self._hits_until_resort = self._RESORT_INTERVAL
+            hits = self._kw_hits
+            self._esc_keywords_lower = {
+                reason: tuple(sorted(kws, key=lambda k: -hits[k]))
+                for reason, kws in self._esc_keywords_lower.items()
+            }
+            self._agent_keywords_lower = {
+                agent: tuple(sorted(kws, key=lambda k: -hits[k]))
+                for agent, kws in self._agent_keywords_lower.items()
+            }
 
     def process(self, pm_output: Dict[str, Any]) -> DecisionOutput:
         """
@@ -189,45 +283,37 @@ class PMDecisionMachine:
         else:
             confidence = 1.0
 
-        # 2. action → decision 변환
-        if action == "ESCALATE" or requires_ceo:
-            return self._build_escalate_decision(summary, tasks, confidence)
-
-        elif action == "DISPATCH":
-            return self._build_dispatch_decision(tasks, summary, confidence)
+        # 2. action → decision 변환 (requires_ceo는 디스패치 전 단락 처리)
+        if requires_ceo:
+            return self._build_escalate_decision(tasks, summary, confidence)
 
-        elif action == "DONE":
-            return DecisionOutput(
-                decision=PMDecision.DONE,
-                targets=[],
-                summary=summary,
-                confidence=confidence
-            )
+        handler = self._action_dispatch.get(action)
+        if handler is not None:
+            return handler(tasks, summary, confidence)
 
-        else:
-            # 알 수 없는 action → BLOCKED
-            return DecisionOutput(
-                decision=PMDecision.BLOCKED,
-                targets=[],
-                summary=f"Unknown action: {action}",
-                confidence=0.0
-            )
+        # 알 수 없는 action → BLOCKED
+        return DecisionOutput(
+            decision=PMDecision.BLOCKED,
+            targets=[],
+            summary=f"Unknown action: {action}",
+            confidence=0.0
+        )
 
     def _validate_summary(self, summary: str) -> Tuple[bool, str]:
         """summary 유효성 검사"""
         if not summary or len(summary.strip()) < 5:
             return False, "summary 너무 짧음"
 
-        for pattern in self._compiled_null_patterns:
-            if pattern.search(summary):
-                return False, f"의미 없는 summary: {pattern.pattern}"
+        m = _NULL_RE.search(summary)
+        if m:
+            return False, f"의미 없는 summary: {m.group(0)}"
 
         return True, ""
 
     def _build_escalate_decision(
         self,
-        summary: str,
         tasks: List[Dict],
+        summary: str,
         confidence: float
     ) -> DecisionOutput:
         """ESCALATE 결정 생성"""
@@ -242,6 +328,20 @@ class PMDecisionMachine:
             confidence=confidence
         )
 
+    def _build_done_decision(
+        self,
+        tasks: List[Dict],
+        summary: str,
+        confidence: float
+    ) -> DecisionOutput:
+        """DONE 결정 생성"""
+        return DecisionOutput(
+            decision=PMDecision.DONE,
+            targets=[],
+            summary=summary,
+            confidence=confidence
+        )
+
     def _build_dispatch_decision(
         self,
         tasks: List[Dict],
@@ -292,15 +392,25 @@ class PMDecisionMachine:
         tasks: List[Dict]
     ) -> EscalationReason:
         """에스컬레이션 사유 추론"""
-        full_text = summary.lower()
-        for task in tasks:
-            full_text += " " + task.get("instruction", "").lower()
-            full_text += " " + task.get("context", "").lower()
+        # 재시도 시 동일 입력의 join/lower 반복을 LRU로 생략
+        tasks_key = tuple(
+            (task.get("instruction", ""), task.get("context", "") or "")
+            for task in tasks
+        )
+        full_text = _build_full_text(summary, tasks_key)
 
-        for reason, keywords in self.ESCALATION_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword.lower() in full_text:
+        if self._esc_automaton is not None:
+            # 단일 스캔으로 매칭된 사유 수집 후 테이블 순서로 우선순위 결정
+            hit_reasons = {owner for _, owner in self._scan_matches(self._esc_automaton, full_text)}
+            for reason in self.ESCALATION_KEYWORDS:
+                if reason in hit_reasons:
                     return reason
+        else:
+            for reason, keywords in self._esc_keywords_lower.items():
+                for keyword in keywords:
+                    if keyword in full_text:
+                        self._record_hit(keyword)
+                        return reason
 
         # 기본값: UNCLEAR
         return EscalationReason.UNCLEAR
@@ -313,12 +423,19 @@ class PMDecisionMachine:
         """
         prompt_lower = prompt.lower()
 
-        # 점수 계산
+        # 점수 계산 (키워드당 1점 - 중복 출현은 1회만 집계)
         scores: Dict[DispatchTarget, int] = {}
-        for agent, keywords in self.AGENT_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw.lower() in prompt_lower)
-            if score > 0:
-                scores[agent] = score
+        if self._agent_automaton is not None:
+            matched = self._scan_matches(self._agent_automaton, prompt_lower)
+            for agent in self.AGENT_KEYWORDS:
+                score = sum(1 for _, owner in matched if owner is agent)
+                if score > 0:
+                    scores[agent] = score
+        else:
+            for agent, keywords in self._agent_keywords_lower.items():
+                score = sum(1 for kw in keywords if kw in prompt_lower)
+                if score > 0:
+                    scores[agent] = score
 
         if not scores:
             return None
@@ -334,26 +451,39 @@ class PMDecisionMachine:
         """
         prompt_lower = prompt.lower()
 
-        for reason, keywords in self.ESCALATION_KEYWORDS.items():
+        if self._esc_automaton is not None:
+            hit_reasons = {owner for _, owner in self._scan_matches(self._esc_automaton, prompt_lower)}
+            for reason in self.ESCALATION_KEYWORDS:
+                if reason in hit_reasons:
+                    return True, reason
+            return False, None
+
+        for reason, keywords in self._esc_keywords_lower.items():
             for keyword in keywords:
-                if keyword.lower() in prompt_lower:
+                if keyword in prompt_lower:
+                    self._record_hit(keyword)
                     return True, reason
 
         return False, None
 
 
+# 의미적 NULL 단일 alternation - 모듈 레벨 1회 컴파일
+# (클래스가 재생성돼도(테스트/핫리로드) 중복 컴파일 없음)
+_NULL_RE = re.compile(
+    "|".join(f"(?:{p})" for p in PMDecisionMachine.NULL_PATTERNS), re.IGNORECASE
+)
+
+
 # =============================================================================
 # 싱글톤
 # =============================================================================
 
-_decision_machine: Optional[PMDecisionMachine] = None
+# 생성 비용이 작으므로 import 시 1회 생성 (호출마다 None 체크 불필요)
+_decision_machine = PMDecisionMachine()
 
 
 def get_decision_machine() -> PMDecisionMachine:
     """PMDecisionMachine 싱글톤"""
-    global _decision_machine
-    if _decision_machine is None:
-        _decision_machine = PMDecisionMachine()
     return _decision_machine
 
 
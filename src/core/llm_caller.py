@@ -13,16 +13,51 @@ LLM API 호출 및 에이전트 로직
 2026.01.09 업데이트:
 - Researcher 날짜 자동 주입 (최신 정보 검색 강제)
 """
+import hashlib
+import io
+import json
 import os
+import re
+from collections import OrderedDict, defaultdict, deque
+from functools import lru_cache
+from heapq import nsmallest
 import time as time_module
 import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import glob as glob_module
+from itertools import islice
+from types import MappingProxyType
 from typing import Optional, Tuple, Dict, Any
 from datetime import datetime
 
 import sys
 from pathlib import Path
 
+# orjson (Rust 구현) 있으면 사용 - Auditor JSON 파싱 2~5배 빠름
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 선택적 LLM SDK - 호출마다 import하지 않도록 모듈 로드 시 1회만 시도
+try:
+    import openai
+except ImportError:
+    openai = None
+
+try:
+    from google import genai as google_genai  # Gemini 3 SDK
+except ImportError:
+    google_genai = None
+
+try:
+    import google.generativeai as legacy_genai  # Gemini 1.5/2.0 SDK
+except ImportError:
+    legacy_genai = None
+
 # 루트 디렉토리를 path에 추가
 root_dir = Path(__file__).parent.parent.parent
 if str(root_dir) not in sys.path:
@@ -37,8 +72,20 @@ from config import (
 # v2.6: Server Logger 연동
 from src.utils.server_logger import log_llm_call, log_error, logger
 
+import logging
+
+# 듀얼 엔진/포맷 게이트/위원회 핫패스 전용 로거
+# print와 달리 레벨이 꺼져 있으면 메시지 포맷 자체를 생략한다
+dual_log = logging.getLogger("hattz_empire.dual_engine")
+
+# call_agent 입력 디버그 로거 - 레벨은 HATTZ_LOG_LEVEL로 import 시 1회 결정
+# (기본 INFO: 운영에서는 디버그 포맷/stderr flush 비용 자체가 발생하지 않음)
+agent_log = logging.getLogger("hattz_empire.llm_caller")
+agent_log.setLevel(os.environ.get("HATTZ_LOG_LEVEL", "INFO").upper())
+
 # v2.6.1: Flow Monitor 연동 (부트로더 원칙 준수 모니터링)
 from src.services.flow_monitor import get_flow_monitor
+from src.services.cli_supervisor import get_supervisor
 
 # v2.5: Output Contract + Format Gate
 from src.core.contracts import (
@@ -55,13 +102,96 @@ from src.core.contracts import (
 # Analyst 파일 컨텍스트 수집 (프로젝트 파일 자동 수집)
 # =============================================================================
 
-# 프로젝트별 루트 경로 매핑
+# 프로젝트별 루트 경로 매핑 (import 시 1회 resolve)
+_HATTZ_ROOT = Path(__file__).resolve().parents[2]
+
 PROJECT_PATHS = {
-    "hattz_empire": Path(__file__).parent.parent.parent,  # 현재 프로젝트
+    "hattz_empire": _HATTZ_ROOT,  # 현재 프로젝트
     "wpcn": Path("C:/Users/hahonggu/Desktop/coin_master/projects/wpcn-backtester-cli-noflask"),
 }
 
 
+@lru_cache(maxsize=8)
+def _resolve_project_root(project_name: str) -> Optional[Path]:
+    """프로젝트 루트 조회 + 존재 확인 (프로세스 생존 중 루트는 사라지지 않으므로 캐시)"""
+    p = PROJECT_PATHS.get(project_name)
+    return p if (p and p.exists()) else None
+
+
+# 순회에서 제외할 디렉토리명 (이름 단위 매칭 - 경로 substring 검사 아님)
+_EXCLUDE_DIRS = frozenset({'__pycache__', '.git', 'node_modules', '.venv', 'venv', '.claude'})
+
+# 주요 파일 목록 (컨텍스트 수집 + 캐시 지문 공용)
+_IMPORTANT_FILES = [
+    "CLAUDE.md", "README.md", "config.py", "app.py",
+    "src/core/llm_caller.py", "src/api/chat.py"
+]
+
+# (project_name, max_files, max_chars) → (지문, 컨텍스트) - mtime 변경 시 무효화
+_CONTEXT_CACHE: Dict[tuple, tuple] = {}
+
+
+def _project_fingerprint(project_root: Path) -> tuple:
+    """루트 디렉토리 + 주요 파일 mtime_ns 지문 (파일 변경 시 캐시 무효화용)"""
+    stamps = []
+    for p in (project_root, *(project_root / f for f in _IMPORTANT_FILES)):
+        try:
+            stamps.append(os.stat(p).st_mtime_ns)
+        except OSError:
+            stamps.append(-1)
+    return tuple(stamps)
+
+
+def _existing_important_files(project_root: Path) -> list:
+    """
+    실제로 존재하는 주요 파일만 선별 (원래 순서 유지)
+
+    파일별 stat 대신 부모 디렉토리당 scandir 1회로 존재 여부를 일괄 확인
+    - N개 stat → 부모 수만큼의 readdir로 축소
+    """
+    by_parent: Dict[str, list] = {}
+    for fname in _IMPORTANT_FILES:
+        parent, _, name = fname.rpartition('/')
+        by_parent.setdefault(parent, []).append((fname, name))
+
+    present = set()
+    for parent, entries in by_parent.items():
+        try:
+            with os.scandir(project_root / parent if parent else project_root) as it:
+                names = {e.name for e in it}
+        except OSError:
+            continue
+        for fname, name in entries:
+            if name in names:
+                present.add(fname)
+
+    return [f for f in _IMPORTANT_FILES if f in present]
+
+
+def _iter_project_files(root: Path, exclude_dirs: frozenset = _EXCLUDE_DIRS):
+    """
+    os.scandir 기반 단일 재귀 순회 (.py/.md 파일 yield)
+
+    glob("**/*.py") + glob("**/*.md") 이중 전체 순회 대신 한 번만 걷고,
+    제외 디렉토리(__pycache__, .git 등)는 디렉토리 *이름*의 set 멤버십으로
+    진입 전에 가지치기한다 (경로 substring 검사였다면 venv_notes.py 같은
+    파일까지 오배제)."""
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in exclude_dirs:
+                            stack.append(entry.path)
+                    elif name.endswith('.py') or name.endswith('.md'):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
 def collect_project_context(project_name: str, max_files: int = 50, max_chars: int = 30000) -> str:
     """
     프로젝트 파일 구조와 주요 파일 내용을 수집하여 Analyst에게 전달할 컨텍스트 생성
@@ -74,83 +204,94 @@ def collect_project_context(project_name: str, max_files: int = 50, max_chars: i
     Returns:
         str: 프로젝트 컨텍스트 문자열
     """
-    project_root = PROJECT_PATHS.get(project_name)
-    if not project_root or not project_root.exists():
+    project_root = _resolve_project_root(project_name)
+    if project_root is None:
         return f"[ERROR] 프로젝트 '{project_name}' 경로를 찾을 수 없습니다."
 
-    context_parts = []
-    context_parts.append(f"# 프로젝트: {project_name}")
-    context_parts.append(f"# 경로: {project_root}")
-    context_parts.append("")
-
-    # 1. 파일 구조 수집
-    context_parts.append("## 파일 구조")
-    py_files = list(project_root.glob("**/*.py"))
-    md_files = list(project_root.glob("**/*.md"))
-
-    # __pycache__, .git, node_modules 제외
-    exclude_dirs = {'__pycache__', '.git', 'node_modules', '.venv', 'venv', '.claude'}
-    py_files = [f for f in py_files if not any(d in str(f) for d in exclude_dirs)]
-    md_files = [f for f in md_files if not any(d in str(f) for d in exclude_dirs)]
+    # 세션당 반복 호출되므로 mtime 지문 기반 캐시 (Analyst 주입 경로)
+    cache_key = (project_name, max_files, max_chars)
+    fingerprint = _project_fingerprint(project_root)
+    cached = _CONTEXT_CACHE.get(cache_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    # 리스트 append + 최종 거대 join 대신 StringIO 버퍼에 직접 기록
+    buf = io.StringIO()
+    write = buf.write
+    write(f"# 프로젝트: {project_name}\n")
+    write(f"# 경로: {project_root}\n\n")
+
+    # 1. 파일 구조 수집 (단일 순회 - 제외 디렉토리는 진입 전 가지치기)
+    write("## 파일 구조\n")
+    py_files = []
+    md_count = 0  # 목록은 쓰지 않으므로 개수만 센다
+    for f in _iter_project_files(project_root, _EXCLUDE_DIRS):
+        if f.suffix == '.py':
+            py_files.append(f)
+        else:
+            md_count += 1
 
-    context_parts.append(f"- Python 파일: {len(py_files)}개")
-    context_parts.append(f"- Markdown 파일: {len(md_files)}개")
-    context_parts.append("")
+    write(f"- Python 파일: {len(py_files)}개\n")
+    write(f"- Markdown 파일: {md_count}개\n\n")
 
     # 2. 디렉토리별 파일 목록
-    context_parts.append("## 디렉토리 구조")
-    dirs = {}
-    for f in py_files[:max_files]:
+    write("## 디렉토리 구조\n")
+    dirs = defaultdict(list)
+    for f in islice(py_files, max_files):  # 슬라이스 복사 없이 상한만 적용
         rel_path = f.relative_to(project_root)
-        parent = str(rel_path.parent)
-        if parent not in dirs:
-            dirs[parent] = []
-        dirs[parent].append(rel_path.name)
+        dirs[str(rel_path.parent)].append(rel_path.name)
 
     for dir_name, files in sorted(dirs.items()):
-        context_parts.append(f"  {dir_name}/")
-        for fname in sorted(files)[:10]:  # 디렉토리당 최대 10개
-            context_parts.append(f"    - {fname}")
+        write(f"  {dir_name}/\n")
+        for fname in nsmallest(10, files):  # 디렉토리당 최대 10개 - 전체 정렬 불필요
+            write(f"    - {fname}\n")
         if len(files) > 10:
-            context_parts.append(f"    ... 외 {len(files) - 10}개")
-    context_parts.append("")
+            write(f"    ... 외 {len(files) - 10}개\n")
+    write("\n")
 
     # 3. 주요 파일 내용 (CLAUDE.md, README.md, config.py 등)
-    context_parts.append("## 주요 파일 내용")
-    important_files = [
-        "CLAUDE.md", "README.md", "config.py", "app.py",
-        "src/core/llm_caller.py", "src/api/chat.py"
-    ]
+    write("## 주요 파일 내용\n")
+    important_files = _existing_important_files(project_root)
 
-    total_chars = len("\n".join(context_parts))
+    # 러닝 카운터 - 조인된 중간 문자열 없이 버퍼 크기로 바이트 예산 추적
     for fname in important_files:
-        if total_chars >= max_chars:
-            context_parts.append(f"\n[TRUNCATED] 최대 {max_chars}자 초과로 중단")
+        if buf.tell() >= max_chars:
+            write(f"\n[TRUNCATED] 최대 {max_chars}자 초과로 중단\n")
             break
 
         fpath = project_root / fname
-        if fpath.exists():
-            try:
-                content = fpath.read_text(encoding='utf-8')
-                # 파일당 최대 5000자
-                if len(content) > 5000:
-                    content = content[:5000] + "\n... (truncated)"
-                context_parts.append(f"\n### {fname}")
-                context_parts.append("```")
-                context_parts.append(content)
-                context_parts.append("```")
-                total_chars += len(content) + 100
-            except Exception as e:
-                context_parts.append(f"\n### {fname}")
-                context_parts.append(f"[ERROR] 읽기 실패: {e}")
-
-    # 4. 테스트 파일 수 (품질 지표)
-    test_files = [f for f in py_files if 'test' in f.name.lower()]
-    context_parts.append(f"\n## 테스트 파일: {len(test_files)}개")
-    for tf in test_files[:5]:
-        context_parts.append(f"  - {tf.relative_to(project_root)}")
-
-    return "\n".join(context_parts)
+        try:
+            # exists() stat + read_text open의 이중 syscall을 open 1회로 fuse
+            # 파일당 상한 5000자 - 초과분은 아예 읽지 않음
+            with open(fpath, encoding='utf-8') as fp:
+                content = fp.read(5001)
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            write(f"\n### {fname}\n[ERROR] 읽기 실패: {e}\n")
+            continue
+
+        if len(content) > 5000:
+            content = content[:5000] + "\n... (truncated)"
+        write(f"\n### {fname}\n```\n")
+        write(content)
+        write("\n```\n")
+
+    # 4. 테스트 파일 수 (품질 지표) - 개수 + 앞 5개 샘플만 유지
+    test_count = 0
+    test_sample = []
+    for f in py_files:
+        if 'test' in f.name.lower():
+            test_count += 1
+            if len(test_sample) < 5:
+                test_sample.append(f)
+    write(f"\n## 테스트 파일: {test_count}개\n")
+    for tf in test_sample:
+        write(f"  - {tf.relative_to(project_root)}\n")
+
+    result = buf.getvalue()
+    _CONTEXT_CACHE[cache_key] = (fingerprint, result)
+    return result
 
 
 # =============================================================================
@@ -236,6 +377,28 @@ LOOP_BREAKER_CONFIG = {
     "ESCALATE_TO_CEO": True,   # 루프 감지시 CEO 에스컬레이션
 }
 
+# 읽기 전용 설정 보호 + 문자열 intern
+# - intern된 문자열은 dict 조회 시 포인터 비교로 단락 (핫패스 디스패치 비용 절감)
+# - MappingProxyType은 실수로 인한 변이로 캐시가 무효화되는 사고 방지
+def _intern_config(d: dict) -> MappingProxyType:
+    interned = {}
+    for k, v in d.items():
+        k = sys.intern(k) if isinstance(k, str) else k
+        if isinstance(v, dict):
+            v = _intern_config(v)
+        elif isinstance(v, str):
+            v = sys.intern(v)
+        interned[k] = v
+    return MappingProxyType(interned)
+
+
+DUAL_ENGINE_ROLES = _intern_config(DUAL_ENGINE_ROLES)
+
+# 역할 membership 검사 전용 (핫패스에서 매핑 조회보다 싼 frozenset 해시 확인)
+_VALID_DUAL_ENGINE_ROLES = frozenset(DUAL_ENGINE_ROLES)
+COUNCIL_MODEL_MAPPING = _intern_config(COUNCIL_MODEL_MAPPING)
+LOOP_BREAKER_CONFIG = _intern_config(LOOP_BREAKER_CONFIG)
+
 # Haiku 모델 추가 (저렴한 위원회용) - config.py에 이미 있으면 스킵
 # 이제 config.py에 claude_haiku가 정의되어 있으므로 이 블록은 폴백용으로만 유지
 
@@ -246,6 +409,7 @@ from src.services import executor
 from src.services import rag
 from src.services.agent_scorecard import get_scorecard
 from src.services import cost_tracker
+from src.core import semantic_cache
 
 
 # =============================================================================
@@ -273,10 +437,30 @@ def call_anthropic(model_config: ModelConfig, messages: list, system_prompt: str
     """Anthropic API → CLI 리다이렉트 (v2.4.3 - API 비용 0원)"""
     from src.services.cli_supervisor import call_claude_cli
 
-    # model_id로 프로필 결정 (opus=coder, sonnet=reviewer)
-    profile = "coder" if "opus" in model_config.model_id.lower() else "reviewer"
+    # 프로필은 ModelConfig 생성 시 이미 결정됨 (opus=coder, sonnet=reviewer)
+    return call_claude_cli(messages, system_prompt, model_config.cli_redirect_profile)
+
+
+@lru_cache(maxsize=32)
+def _thinking_prompt(system_prompt: str) -> str:
+    """THINKING_EXTEND_PREFIX 결합 캐시 (같은 프롬프트 재결합 방지)"""
+    return THINKING_EXTEND_PREFIX + system_prompt
+
 
-    return call_claude_cli(messages, system_prompt, profile)
+@lru_cache(maxsize=4)
+def _openai_client(api_key_env: str):
+    """OpenAI 클라이언트 캐시 (호출마다 커넥션 풀 재생성 방지)"""
+    if openai is None:
+        raise ImportError("openai 패키지가 설치되지 않았습니다")
+    return openai.OpenAI(api_key=os.getenv(api_key_env))
+
+
+@lru_cache(maxsize=4)
+def _genai_client(api_key_env: str):
+    """Gemini 3 클라이언트 캐시"""
+    if google_genai is None:
+        raise ImportError("google-genai 패키지가 설치되지 않았습니다")
+    return google_genai.Client(api_key=os.getenv(api_key_env))
 
 
 def call_openai(model_config: ModelConfig, messages: list, system_prompt: str) -> tuple[str, int, int]:
@@ -291,20 +475,18 @@ def call_openai(model_config: ModelConfig, messages: list, system_prompt: str) -
         (response_text, input_tokens, output_tokens)
     """
     try:
-        import openai
-        client = openai.OpenAI(api_key=os.getenv(model_config.api_key_env))
+        client = _openai_client(model_config.api_key_env)
 
         # 프롬프트 주입 (thinking_mode일 때 추가 지침)
-        if getattr(model_config, 'thinking_mode', False):
-            system_prompt = THINKING_EXTEND_PREFIX + system_prompt
+        if model_config.thinking_mode:
+            system_prompt = _thinking_prompt(system_prompt)
 
-        full_messages = [{"role": "system", "content": system_prompt}]
-        full_messages.extend(messages)
+        full_messages = [{"role": "system", "content": system_prompt}, *messages]
 
         # GPT-5.2 계열: reasoning_effort 지원 + temperature 충돌 방지
         if model_config.model_id.startswith("gpt-5"):
             # reasoning_effort 가져오기 (AGENT_CONFIG에서 설정)
-            reasoning_effort = getattr(model_config, 'reasoning_effort', None)
+            reasoning_effort = model_config.reasoning_effort
 
             # reasoning_effort가 설정되어 있으면 (high/xhigh)
             # → temperature/top_p 사용 불가 (OpenAI 제약)
@@ -351,13 +533,15 @@ def call_google(model_config: ModelConfig, messages: list, system_prompt: str) -
     """
     try:
         if "gemini-3" in model_config.model_id:
-            from google import genai
-            client = genai.Client(api_key=os.getenv(model_config.api_key_env))
+            client = _genai_client(model_config.api_key_env)
 
-            contents = []
-            for msg in messages:
-                role = "user" if msg["role"] == "user" else "model"
-                contents.append({"role": role, "parts": [{"text": msg["content"]}]})
+            contents = [
+                {
+                    "role": "user" if msg["role"] == "user" else "model",
+                    "parts": [{"text": msg["content"]}],
+                }
+                for msg in messages
+            ]
 
             response = client.models.generate_content(
                 model=model_config.model_id,
@@ -378,18 +562,22 @@ def call_google(model_config: ModelConfig, messages: list, system_prompt: str) -
 
             return response.text, input_tokens, output_tokens
         else:
-            import google.generativeai as genai
-            genai.configure(api_key=os.getenv(model_config.api_key_env))
+            if legacy_genai is None:
+                raise ImportError("google-generativeai 패키지가 설치되지 않았습니다")
+            legacy_genai.configure(api_key=os.getenv(model_config.api_key_env))
 
-            model = genai.GenerativeModel(
+            model = legacy_genai.GenerativeModel(
                 model_name=model_config.model_id,
                 system_instruction=system_prompt
             )
 
-            history = []
-            for msg in messages[:-1]:
-                role = "user" if msg["role"] == "user" else "model"
-                history.append({"role": role, "parts": [msg["content"]]})
+            history = [
+                {
+                    "role": "user" if msg["role"] == "user" else "model",
+                    "parts": [msg["content"]],
+                }
+                for msg in messages[:-1]
+            ]
 
             chat = model.start_chat(history=history)
             response = chat.send_message(messages[-1]["content"])
@@ -406,6 +594,35 @@ def call_google(model_config: ModelConfig, messages: list, system_prompt: str) -
         return f"[Google Error] {str(e)}", 0, 0
 
 
+# 비용 기록 백그라운드 플러셔 - 응답 반환이 DB 쓰기를 기다리지 않도록 분리
+_cost_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_cost_flusher_started = False
+_cost_flusher_lock = threading.Lock()
+
+
+def _cost_flusher():
+    """큐에 쌓인 비용 기록을 순서대로 DB에 반영 (데몬 스레드)"""
+    while True:
+        record = _cost_queue.get()
+        try:
+            cost_tracker.record_api_call(**record)
+            print(f"[CostTracker] Recorded: {record['model_id']} "
+                  f"({record['input_tokens']}in/{record['output_tokens']}out)")
+        except Exception as e:
+            print(f"[CostTracker] Failed to record: {e}")
+
+
+def _ensure_cost_flusher():
+    """플러셔 스레드 지연 기동 (첫 기록 시점에 1회)"""
+    global _cost_flusher_started
+    if _cost_flusher_started:
+        return
+    with _cost_flusher_lock:
+        if not _cost_flusher_started:
+            threading.Thread(target=_cost_flusher, name="cost-flusher", daemon=True).start()
+            _cost_flusher_started = True
+
+
 def call_llm(
     model_config: ModelConfig,
     messages: list,
@@ -440,64 +657,69 @@ def call_llm(
     elif model_config.provider == "claude_cli":
         # Claude Code CLI provider (EXEC tier) - 무료
         from src.services.cli_supervisor import call_claude_cli
-        response_text = call_claude_cli(messages, system_prompt, getattr(model_config, 'profile', 'coder'))
+        response_text = call_claude_cli(messages, system_prompt, model_config.profile)
     else:
         return f"[Error] Unknown provider: {model_config.provider}"
 
     # 비용 기록 (토큰이 있고 에러가 아닌 경우)
     if input_tokens > 0 or output_tokens > 0:
-        if not response_text.startswith("[") or not "Error]" in response_text:
-            try:
-                cost_tracker.record_api_call(
-                    session_id=session_id or "unknown",
-                    agent_role=agent_role or "unknown",
-                    model_id=model_config.model_id,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens
-                )
-                print(f"[CostTracker] Recorded: {model_config.model_id} ({input_tokens}in/{output_tokens}out)")
-            except Exception as e:
-                print(f"[CostTracker] Failed to record: {e}")
+        # 에러 마커는 항상 응답 앞부분에 붙음 → 전체 본문 스캔 대신 머리만 확인
+        if not response_text.startswith("[") or "Error]" not in response_text[:64]:
+            _ensure_cost_flusher()
+            _cost_queue.put({
+                "session_id": session_id or "unknown",
+                "agent_role": agent_role or "unknown",
+                "model_id": model_config.model_id,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+            })
 
     return response_text
 
 
+@lru_cache(maxsize=16)
+def _merge_templates(engine_1_name: str, engine_2_name: str) -> dict:
+    """엔진 이름이 박힌 병합 템플릿 (엔진 쌍당 1회 생성, 응답만 format으로 주입)"""
+    return {
+        "primary_fallback": (
+            f"## {engine_1_name} (Primary)\n{{0}}\n\n"
+            f"---\n## {engine_2_name} (Review)\n{{1}}"
+        ),
+        "parallel": (
+            f"## {engine_1_name}\n{{0}}\n\n"
+            f"---\n## {engine_2_name}\n{{1}}"
+        ),
+        "default": (
+            f"## {engine_1_name}\n{{0}}\n\n"
+            f"---\n## {engine_2_name}\n{{1}}\n\n"
+            "---\n**듀얼 엔진 분석 완료. 두 결과를 비교 검토하세요.**"
+        ),
+    }
+
+
 def call_dual_engine(role: str, messages: list, system_prompt: str) -> str:
     """듀얼 엔진 호출 및 병합 (레거시 - config.py DUAL_ENGINES 사용)"""
     config = DUAL_ENGINES.get(role)
     if not config:
         return f"[Error] Unknown dual engine role: {role}"
 
-    response_1 = call_llm(config.engine_1, messages, system_prompt)
-    response_2 = call_llm(config.engine_2, messages, system_prompt)
+    # 두 엔진 호출은 서로 독립적인 네트워크 I/O → 동시 실행으로 대기 시간 절반
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        future_1 = pool.submit(call_llm, config.engine_1, messages, system_prompt)
+        future_2 = pool.submit(call_llm, config.engine_2, messages, system_prompt)
+        response_1 = future_1.result()
+        response_2 = future_2.result()
 
+    templates = _merge_templates(config.engine_1.name, config.engine_2.name)
     if config.merge_strategy == "primary_fallback":
         if "[Error]" not in response_1:
-            merged = f"""## {config.engine_1.name} (Primary)
-{response_1}
-
----
-## {config.engine_2.name} (Review)
-{response_2}"""
+            merged = templates["primary_fallback"].format(response_1, response_2)
         else:
             merged = response_2
     elif config.merge_strategy == "parallel":
-        merged = f"""## {config.engine_1.name}
-{response_1}
-
----
-## {config.engine_2.name}
-{response_2}"""
+        merged = templates["parallel"].format(response_1, response_2)
     else:
-        merged = f"""## {config.engine_1.name}
-{response_1}
-
----
-## {config.engine_2.name}
-{response_2}
-
----
-**듀얼 엔진 분석 완료. 두 결과를 비교 검토하세요.**"""
+        merged = templates["default"].format(response_1, response_2)
 
     stream = get_stream()
     stream.log_dual_engine(role, messages[-1]["content"], response_1, response_2, merged)
@@ -508,6 +730,11 @@ def call_dual_engine(role: str, messages: list, system_prompt: str) -> str:
 # =============================================================================
 # 듀얼 엔진 V2 (Writer + Auditor 패턴)
 # =============================================================================
+# NOTE: Auditor 응답을 스트리밍으로 받아 "verdict":"APPROVE" 시점에 생성을
+# 중단하는 최적화는 현 구조에서 불가. Auditor는 Claude CLI --print 경유라
+# 출력이 프로세스 종료 시 한 번에 도착하고, 생성 중 kill은 --resume 세션
+# 상태(call_count/세션 북키핑)를 깨뜨린다. CLI가 스트리밍 출력을 지원하면
+# 재검토할 것.
 
 # Auditor JSON 스키마 (출력 강제용)
 AUDITOR_JSON_SCHEMA = {
@@ -524,30 +751,105 @@ AUDITOR_JSON_SCHEMA = {
 }
 
 
+# 에러 마커는 항상 접두사로 붙음 → 전체 본문 스캔 대신 startswith
+_ERR_PREFIXES = ("[Error]", "[CLI Error]")
+
+# Auditor 응답에서 ```json ...``` 블록 추출 (모듈 로드 시 1회 컴파일)
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*\n?({[\s\S]*?})\s*\n?```')
+
+# orjson.JSONDecodeError와 json.JSONDecodeError 모두 ValueError 하위 클래스
+_loads_json = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+@lru_cache(maxsize=16)
+def _auditor_static_prompt(role: str) -> str:
+    """
+    Auditor 프롬프트의 정적 구간 (역할당 1회 생성)
+
+    규칙/스키마/판정 기준은 호출마다 동일하므로 앞쪽에 고정한다.
+    접두사가 안정되면 모델 쪽 prompt-prefix 캐시도 적중 가능.
+    """
+    return f"""당신은 {role} 작업의 Auditor(감사관)입니다.
+
+## 절대 규칙 (위반 시 즉시 무효)
+1. **수정 금지**: "내가 고쳐줄게요" 절대 금지. 오직 판정만.
+2. **인용 필수**: 모든 지적은 파일경로/함수명/라인/에러 재현 커맨드로 증거 제시.
+   - "느낌상 별로" 같은 감상문 = 즉시 REJECT 처리됨
+3. **Lazy Approval**: must_fix는 Severity HIGH만 허용:
+   - 보안 취약점 (인증/권한 우회, injection)
+   - 데이터 손상/유실 가능성
+   - 크래시/무한루프
+   - 핵심 경로 테스트 부재
+   - 명백한 요구사항 불일치
+4. **스타일/취향/변수명** = nice_to_fix로만 (반려 사유 불가)
+
+**반드시 아래 JSON 형식으로만 응답하세요 (코드블록 없이 순수 JSON):**
+
+{{
+  "verdict": "APPROVE | REVISE | REJECT",
+  "must_fix": [
+    {{
+      "severity": "HIGH",
+      "issue": "문제 설명",
+      "evidence": "파일:라인 또는 재현 커맨드",
+      "fix_hint": "수정 방향 (코드 아님)"
+    }}
+  ],
+  "nice_to_fix": ["권장사항 (반려 사유 아님)"],
+  "tests_to_add": ["추가할 테스트 케이스명"],
+  "evidence": ["검증에 사용한 파일/함수/라인 목록"],
+  "risk_level": "LOW | MEDIUM | HIGH | CRITICAL",
+  "requires_council": false,
+  "confidence": 85,
+  "rewrite_instructions": "REVISE일 때만: Writer에게 전달할 구체적 지시"
+}}
+
+## Verdict 기준
+- **APPROVE**: must_fix 없음, 요구사항 충족
+- **REVISE**: must_fix 1개 이상 (HIGH severity만)
+- **REJECT**: 근본적 설계 결함 또는 요구사항 완전 불일치 → Council 필수
+"""
+
+
+def _fmt_must_fix(items: list) -> str:
+    """
+    must_fix 목록을 불릿 문자열로 변환
+
+    스키마상 항목은 문자열이지만 일부 Auditor가 {severity, issue}
+    dict로 출력하는 경우가 있어 dict repr가 프롬프트에 섞이지 않게 처리.
+    """
+    lines = []
+    for item in items:
+        if isinstance(item, dict):
+            lines.append(f"- [{item.get('severity', '?')}] {item.get('issue', '')}")
+        else:
+            lines.append(f"- {item}")
+    return "\n".join(lines)
+
+
 def _extract_json_from_text(text: str) -> dict:
     """
     텍스트에서 JSON 객체 추출 (v2.3.3)
 
     마크다운 코드블록, 순수 JSON 모두 지원
     """
-    import json
-    import re
-
-    # 1차: ```json ... ``` 블록 찾기
-    json_block = re.search(r'```(?:json)?\s*\n?({[\s\S]*?})\s*\n?```', text)
-    if json_block:
-        try:
-            return json.loads(json_block.group(1))
-        except json.JSONDecodeError:
-            pass
+    # 1차: 펜스 토큰이 있을 때만 정규식 경로
+    # (Auditor 다수는 순수 JSON 출력 - 흔한 경로에서 regex 스캔 생략)
+    if "```" in text:
+        json_block = _JSON_FENCE_RE.search(text)
+        if json_block:
+            try:
+                return _loads_json(json_block.group(1))
+            except ValueError:
+                pass
 
     # 2차: 순수 JSON 객체 찾기 (첫 '{' ~ 마지막 '}')
     start = text.find('{')
     end = text.rfind('}')
     if start != -1 and end != -1 and end > start:
         try:
-            return json.loads(text[start:end + 1])
-        except json.JSONDecodeError:
+            return _loads_json(text[start:end + 1])
+        except ValueError:
             pass
 
     # 3차: 실패 시 기본값 반환
@@ -561,12 +863,170 @@ def _extract_json_from_text(text: str) -> dict:
     }
 
 
+# 듀얼 엔진 exact-match 캐시 (opt-in: DUAL_ENGINE_CACHE=1)
+# LLM 출력은 비결정적이므로 기본은 꺼 둠 - 동일 입력 반복(재시도/개발 반복)에서만 사용
+_DUAL_CACHE: "OrderedDict[bytes, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+_DUAL_CACHE_MAX = 256
+_DUAL_CACHE_LOCK = threading.Lock()
+
+
+def _dual_cache_key(role: str, messages: list, system_prompt: str) -> bytes:
+    """(역할, 메시지, 프롬프트) 바이트 단위 동일성 키 (blake2b 16바이트)"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(role.encode())
+    h.update(b"\x00")
+    h.update(system_prompt.encode())
+    for m in messages:
+        h.update(b"\x01")
+        h.update(m["role"].encode())
+        h.update(b"\x00")
+        h.update(m["content"].encode())
+    return h.digest()
+
+
+# 의미 기반 캐시 (opt-in: DUAL_ENGINE_SEMANTIC_CACHE=1)
+# 외부 임베딩 모델 없이 SimHash 지문으로 유사 질의(패러프레이즈) 근사 매칭.
+# APPROVE로 끝난 결과만 저장 - REVISE/REJECT 결과 재사용은 품질 리스크.
+_SEMANTIC_CACHE: list = []  # (role, fingerprint, draft, meta)
+_SEMANTIC_CACHE_MAX = 128
+_SEMANTIC_SIM_THRESHOLD = 0.95
+_SEMANTIC_CACHE_LOCK = threading.Lock()
+
+
+def _semantic_cache_lookup(role: str, query: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """역할이 같고 SimHash 유사도가 임계치 이상인 캐시 항목 탐색 (top-1)"""
+    fingerprint = _simhash(query)
+    best = None
+    best_sim = _SEMANTIC_SIM_THRESHOLD
+    with _SEMANTIC_CACHE_LOCK:
+        for cached_role, cached_fp, draft, meta in _SEMANTIC_CACHE:
+            if cached_role != role:
+                continue
+            sim = _simhash_similarity(fingerprint, cached_fp)
+            if sim >= best_sim:
+                best_sim = sim
+                best = (draft, meta)
+    return best
+
+
+def _semantic_cache_store(role: str, query: str, draft: str, meta: Dict[str, Any]):
+    """APPROVE 결과만 저장 (FIFO 상한)"""
+    with _SEMANTIC_CACHE_LOCK:
+        _SEMANTIC_CACHE.append((role, _simhash(query), draft, meta))
+        if len(_SEMANTIC_CACHE) > _SEMANTIC_CACHE_MAX:
+            del _SEMANTIC_CACHE[0]
+
+
 def dual_engine_write_audit_rewrite(
     role: str,
     messages: list,
     system_prompt: str,
     max_rewrite: int = 3,
     session_id: str = None
+) -> Tuple[str, Dict[str, Any]]:
+    """듀얼 엔진 V3 진입점 - DUAL_ENGINE_CACHE / DUAL_ENGINE_SEMANTIC_CACHE로 결과 재사용"""
+    use_exact = os.getenv("DUAL_ENGINE_CACHE") == "1"
+    use_semantic = os.getenv("DUAL_ENGINE_SEMANTIC_CACHE") == "1"
+    if not use_exact and not use_semantic:
+        return _dual_engine_write_audit_rewrite(role, messages, system_prompt, max_rewrite, session_id)
+
+    if use_exact:
+        key = _dual_cache_key(role, messages, system_prompt)
+        with _DUAL_CACHE_LOCK:
+            cached = _DUAL_CACHE.get(key)
+            if cached is not None:
+                _DUAL_CACHE.move_to_end(key)
+                dual_log.info("[Dual-V3] 캐시 적중: %s (LLM 호출 생략)", role)
+                return cached
+
+    last_user_message = messages[-1]["content"] if messages else ""
+    if use_semantic and last_user_message:
+        hit = _semantic_cache_lookup(role, last_user_message)
+        if hit is not None:
+            dual_log.info("[Dual-V3] 의미 캐시 적중: %s (LLM 호출 생략)", role)
+            return hit
+
+    result = _dual_engine_write_audit_rewrite(role, messages, system_prompt, max_rewrite, session_id)
+
+    if use_exact:
+        with _DUAL_CACHE_LOCK:
+            _DUAL_CACHE[key] = result
+            _DUAL_CACHE.move_to_end(key)
+            while len(_DUAL_CACHE) > _DUAL_CACHE_MAX:
+                _DUAL_CACHE.popitem(last=False)
+    if use_semantic and last_user_message and result[1].get("verdict") == "APPROVE":
+        _semantic_cache_store(role, last_user_message, result[0], result[1])
+    return result
+
+
+async def _call_model_or_cli_async(*args, **kwargs) -> Tuple[str, str]:
+    """_call_model_or_cli의 비동기 형제 (스레드 위임 - 이벤트 루프 비차단)"""
+    return await asyncio.to_thread(_call_model_or_cli, *args, **kwargs)
+
+
+async def dual_engine_write_audit_rewrite_async(
+    role: str,
+    messages: list,
+    system_prompt: str,
+    max_rewrite: int = 3,
+    session_id: str = None
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    dual_engine_write_audit_rewrite의 비동기 래퍼
+
+    Write → Audit → Rewrite는 각 단계가 이전 단계 출력을 소비하는
+    직렬 파이프라인이라 단일 역할 내 병렬화 여지는 없다.
+    대신 스레드로 위임해 이벤트 루프를 막지 않게 하고, 여러 역할의
+    동시 실행은 이 래퍼를 gather로 묶어 달성한다.
+    """
+    return await asyncio.to_thread(
+        dual_engine_write_audit_rewrite, role, messages, system_prompt, max_rewrite, session_id
+    )
+
+
+# CLI 서브프로세스 폭주 방지용 동시 실행 상한
+_DUAL_BATCH_CONCURRENCY = 8
+
+
+def dual_engine_write_audit_rewrite_batch(specs: list) -> list:
+    """
+    여러 역할의 듀얼 엔진 V3를 동시 실행 (v2.6)
+
+    각 spec의 Write→Audit→Rewrite 루프가 독립 태스크로 돌아
+    N개 역할이 N×(Writer+Auditor) 직렬 시간 대신 가장 느린
+    역할의 시간에 수렴한다. 동시 실행은 세마포어로 8개 제한.
+
+    Args:
+        specs: [{"role", "messages", "system_prompt",
+                 "max_rewrite"(선택), "session_id"(선택)}, ...]
+
+    Returns:
+        specs와 같은 순서의 (최종 응답, 메타데이터) 리스트
+    """
+    async def _run_all():
+        sem = asyncio.Semaphore(_DUAL_BATCH_CONCURRENCY)
+
+        async def _one(spec):
+            async with sem:
+                return await dual_engine_write_audit_rewrite_async(
+                    spec["role"],
+                    spec["messages"],
+                    spec["system_prompt"],
+                    spec.get("max_rewrite", 3),
+                    spec.get("session_id"),
+                )
+
+        return await asyncio.gather(*(_one(s) for s in specs))
+
+    return asyncio.run(_run_all())
+
+
+def _dual_engine_write_audit_rewrite(
+    role: str,
+    messages: list,
+    system_prompt: str,
+    max_rewrite: int = 3,
+    session_id: str = None
 ) -> Tuple[str, Dict[str, Any]]:
     """
     듀얼 엔진 V3: Write → Audit → Rewrite 패턴 (v2.3.3)
@@ -581,9 +1041,8 @@ def dual_engine_write_audit_rewrite(
     Returns:
         (최종 응답, 메타데이터)
     """
-    if role not in DUAL_ENGINE_ROLES:
-        from src.services.cli_supervisor import CLISupervisor
-        cli = CLISupervisor()
+    if role not in _VALID_DUAL_ENGINE_ROLES:
+        cli = get_supervisor()
         result = cli.call_cli(messages[-1]["content"], system_prompt, "coder", session_id=session_id)
         return (result.output if result.success else f"[Error] {result.error}"), {"dual": False}
 
@@ -598,71 +1057,36 @@ def dual_engine_write_audit_rewrite(
     format_validated = False
 
     # 1단계: Writer 초안 작성 (v2.5 Format Gate 적용)
-    print(f"[Dual-V3] {role} Writer ({writer_key}) 초안 작성 중...")
+    dual_log.info("[Dual-V3] %s Writer (%s) 초안 작성 중...", role, writer_key)
     draft, writer_name, format_validated = _call_with_contract(
         writer_key, messages, system_prompt, writer_profile, role, session_id=session_id
     )
 
-    if "[Error]" in draft or "[CLI Error]" in draft:
+    if draft.startswith(_ERR_PREFIXES):
         return draft, {"dual": True, "error": "writer_failed", "version": "v3"}
 
     # v2.5: Format Gate 경고 표시
-    if not format_validated and "[FORMAT_WARNING]" in draft:
-        print(f"[Dual-V3] Writer 출력 형식 검증 실패, Auditor에게 전달")
-        draft = draft.replace("[FORMAT_WARNING] ", "")
+    if not format_validated and draft.startswith("[FORMAT_WARNING]"):
+        dual_log.info("[Dual-V3] Writer 출력 형식 검증 실패, Auditor에게 전달")
+        draft = draft.removeprefix("[FORMAT_WARNING] ")
 
     while rewrite_count < max_rewrite:
         # 2단계: Auditor 리뷰 (JSON 출력 강제) - v2.4.2 강화된 프롬프트
-        auditor_prompt = f"""당신은 {role} 작업의 Auditor(감사관)입니다.
-
-## 절대 규칙 (위반 시 즉시 무효)
-1. **수정 금지**: "내가 고쳐줄게요" 절대 금지. 오직 판정만.
-2. **인용 필수**: 모든 지적은 파일경로/함수명/라인/에러 재현 커맨드로 증거 제시.
-   - "느낌상 별로" 같은 감상문 = 즉시 REJECT 처리됨
-3. **Lazy Approval**: must_fix는 Severity HIGH만 허용:
-   - 보안 취약점 (인증/권한 우회, injection)
-   - 데이터 손상/유실 가능성
-   - 크래시/무한루프
-   - 핵심 경로 테스트 부재
-   - 명백한 요구사항 불일치
-4. **스타일/취향/변수명** = nice_to_fix로만 (반려 사유 불가)
-
-=== WRITER 결과물 ===
-{draft}
-======================
-
-**반드시 아래 JSON 형식으로만 응답하세요 (코드블록 없이 순수 JSON):**
-
-{{
-  "verdict": "APPROVE | REVISE | REJECT",
-  "must_fix": [
-    {{
-      "severity": "HIGH",
-      "issue": "문제 설명",
-      "evidence": "파일:라인 또는 재현 커맨드",
-      "fix_hint": "수정 방향 (코드 아님)"
-    }}
-  ],
-  "nice_to_fix": ["권장사항 (반려 사유 아님)"],
-  "tests_to_add": ["추가할 테스트 케이스명"],
-  "evidence": ["검증에 사용한 파일/함수/라인 목록"],
-  "risk_level": "LOW | MEDIUM | HIGH | CRITICAL",
-  "requires_council": false,
-  "confidence": 85,
-  "rewrite_instructions": "REVISE일 때만: Writer에게 전달할 구체적 지시"
-}}
-
-## Verdict 기준
-- **APPROVE**: must_fix 없음, 요구사항 충족
-- **REVISE**: must_fix 1개 이상 (HIGH severity만)
-- **REJECT**: 근본적 설계 결함 또는 요구사항 완전 불일치 → Council 필수
-"""
+        # 정적 구간(규칙/스키마)을 앞에 고정하고 draft만 꼬리에 붙임
+        # → 같은 역할의 반복 감사에서 프롬프트 접두사가 바이트 단위로 동일
+        auditor_prompt = (
+            _auditor_static_prompt(role)
+            + f"\n=== WRITER 결과물 ===\n{draft}\n======================\n"
+        )
 
-        auditor_messages = messages.copy()
-        auditor_messages.append({"role": "assistant", "content": draft})
-        auditor_messages.append({"role": "user", "content": auditor_prompt})
+        # copy+append 3회 대신 단일 리스트 리터럴 (참조만 복사)
+        auditor_messages = [
+            *messages,
+            {"role": "assistant", "content": draft},
+            {"role": "user", "content": auditor_prompt},
+        ]
 
-        print(f"[Dual-V3] {role} Auditor ({auditor_key}) 리뷰 중...")
+        dual_log.info("[Dual-V3] %s Auditor (%s) 리뷰 중...", role, auditor_key)
         auditor_response, auditor_name = _call_model_or_cli(
             auditor_key, auditor_messages, system_prompt, auditor_profile, session_id, f"{role}_auditor"
         )
@@ -672,7 +1096,7 @@ def dual_engine_write_audit_rewrite(
         audit_history.append(audit)
 
         verdict = audit.get("verdict", "REVISE")
-        print(f"[Dual-V3] Auditor verdict: {verdict} (confidence: {audit.get('confidence', 'N/A')})")
+        dual_log.info("[Dual-V3] Auditor verdict: %s (confidence: %s)", verdict, audit.get('confidence', 'N/A'))
 
         # APPROVE: 초안 그대로 반환
         if verdict == "APPROVE":
@@ -712,17 +1136,17 @@ def dual_engine_write_audit_rewrite(
 
 ---
 **Rejection Reasons:**
-{chr(10).join(f'- {item}' for item in audit.get('must_fix', []))}
+{_fmt_must_fix(audit.get('must_fix', []))}
 """, meta
 
         # REVISE: Writer에게 피드백 전달하여 재작성
         rewrite_count += 1
-        print(f"[Dual-V3] Rewrite #{rewrite_count}...")
+        dual_log.info("[Dual-V3] Rewrite #%d...", rewrite_count)
 
         rewrite_prompt = f"""이전 초안에 대해 Auditor가 다음 수정을 요청했습니다:
 
 **반드시 수정할 항목:**
-{chr(10).join(f'- {item}' for item in audit.get('must_fix', []))}
+{_fmt_must_fix(audit.get('must_fix', []))}
 
 **Auditor 지시사항:**
 {audit.get('rewrite_instructions', '위 항목들을 수정해주세요.')}
@@ -737,20 +1161,19 @@ def dual_engine_write_audit_rewrite(
 위 피드백을 반영하여 수정된 버전을 작성해주세요.
 """
 
-        rewrite_messages = messages.copy()
-        rewrite_messages.append({"role": "user", "content": rewrite_prompt})
+        rewrite_messages = [*messages, {"role": "user", "content": rewrite_prompt}]
 
         # v2.5 Format Gate 적용
         draft, writer_name, format_validated = _call_with_contract(
             writer_key, rewrite_messages, system_prompt, writer_profile, role
         )
 
-        if "[Error]" in draft or "[CLI Error]" in draft:
+        if draft.startswith(_ERR_PREFIXES):
             return draft, {"dual": True, "error": "rewrite_failed", "version": "v3"}
 
         # v2.5: Format Gate 경고 제거
-        if "[FORMAT_WARNING]" in draft:
-            draft = draft.replace("[FORMAT_WARNING] ", "")
+        if draft.startswith("[FORMAT_WARNING]"):
+            draft = draft.removeprefix("[FORMAT_WARNING] ")
 
     # max_rewrite 소진 시 마지막 draft 반환
     meta = {
@@ -791,8 +1214,7 @@ def _call_model_or_cli(
         (응답, 모델명)
     """
     if model_key == "claude_cli":
-        from src.services.cli_supervisor import CLISupervisor
-        cli = CLISupervisor()
+        cli = get_supervisor()
         # 메시지에서 마지막 user 메시지 추출
         user_message = messages[-1]["content"] if messages else ""
         result = cli.call_cli(
@@ -811,6 +1233,12 @@ def _call_model_or_cli(
         return call_llm(model, messages, system_prompt, session_id, agent_role), model.name
 
 
+@lru_cache(maxsize=64)
+def _contract_prompt(system_prompt: str, agent_role: str) -> str:
+    """시스템 프롬프트 + 스키마 프롬프트 결합 캐시 (역할/프롬프트 쌍당 1회)"""
+    return f"{system_prompt}\n\n{get_schema_prompt(agent_role)}"
+
+
 def _call_with_contract(
     model_key: str,
     messages: list,
@@ -842,9 +1270,12 @@ def _call_with_contract(
         response, model_name = _call_model_or_cli(model_key, messages, system_prompt, profile, session_id, agent_role)
         return response, model_name, True
 
-    # Schema 프롬프트를 시스템 프롬프트에 주입
-    schema_prompt = get_schema_prompt(agent_role)
-    enhanced_prompt = f"{system_prompt}\n\n{schema_prompt}"
+    # Schema 프롬프트를 시스템 프롬프트에 주입 (재시도 루프 밖에서 1회, 쌍 단위 캐시)
+    enhanced_prompt = _contract_prompt(system_prompt, agent_role)
+
+    # 재시도 메시지의 고정 구간도 루프 밖에서 1회만 조립 (error만 매번 끼움)
+    retry_prefix = "이전 응답이 형식 오류로 거부되었습니다.\n\n**오류 내용:**\n"
+    retry_suffix = f"\n\n**올바른 형식으로 다시 응답해주세요.**\n\n{get_schema_prompt(agent_role)}"
 
     last_error = None
 
@@ -852,14 +1283,14 @@ def _call_with_contract(
         response, model_name = _call_model_or_cli(model_key, messages, enhanced_prompt, profile, session_id, agent_role)
 
         # 에러 응답은 검증 스킵
-        if "[Error]" in response or "[CLI Error]" in response:
+        if response.startswith(_ERR_PREFIXES):
             return response, model_name, False
 
         # Output Contract 검증
         success, validated, error = validate_output(response, agent_role)
 
         if success:
-            print(f"[FormatGate] {agent_role} 검증 성공 (attempt {attempt + 1})")
+            dual_log.debug("[FormatGate] %s 검증 성공 (attempt %d)", agent_role, attempt + 1)
             # Pydantic 모델을 JSON 문자열로 반환
             if hasattr(validated, 'model_dump_json'):
                 return validated.model_dump_json(indent=2), model_name, True
@@ -867,24 +1298,19 @@ def _call_with_contract(
 
         # 검증 실패 시 에러 메시지로 재시도
         last_error = error
-        print(f"[FormatGate] {agent_role} 검증 실패 ({attempt + 1}/{max_retry}): {error[:100]}")
+        dual_log.info("[FormatGate] %s 검증 실패 (%d/%d): %s", agent_role, attempt + 1, max_retry, error[:100])
 
         if attempt < max_retry - 1:
-            # 에러 피드백을 포함한 재시도 메시지
-            retry_prompt = f"""이전 응답이 형식 오류로 거부되었습니다.
-
-**오류 내용:**
-{error}
-
-**올바른 형식으로 다시 응답해주세요.**
-
-{schema_prompt}"""
-            messages = messages.copy()
-            messages.append({"role": "assistant", "content": response})
-            messages.append({"role": "user", "content": retry_prompt})
+            # 에러 피드백을 포함한 재시도 메시지 (고정 구간 + error)
+            retry_prompt = retry_prefix + error + retry_suffix
+            messages = [
+                *messages,
+                {"role": "assistant", "content": response},
+                {"role": "user", "content": retry_prompt},
+            ]
 
     # 최대 재시도 초과 - 원본 응답 반환 + 경고
-    print(f"[FormatGate] {agent_role} 최대 재시도 초과, 원본 응답 사용")
+    dual_log.info("[FormatGate] %s 최대 재시도 초과, 원본 응답 사용", agent_role)
     return f"[FORMAT_WARNING] {response}", model_name, False
 
 
@@ -904,10 +1330,9 @@ def call_dual_engine_v2(
     Returns:
         (최종 응답, 메타데이터)
     """
-    if role not in DUAL_ENGINE_ROLES:
+    if role not in _VALID_DUAL_ENGINE_ROLES:
         # 듀얼 엔진 역할이 아니면 CLI로 폴백
-        from src.services.cli_supervisor import CLISupervisor
-        cli = CLISupervisor()
+        cli = get_supervisor()
         result = cli.call_cli(messages[-1]["content"], system_prompt, "coder")
         return (result.output if result.success else f"[Error] {result.error}"), {"dual": False}
 
@@ -918,44 +1343,25 @@ def call_dual_engine_v2(
     auditor_profile = config.get("auditor_profile", "reviewer")
 
     # 1단계: Writer 초안 작성
-    print(f"[Dual-V2] {role} Writer ({writer_key}) 작업 중...")
+    dual_log.info("[Dual-V2] %s Writer (%s) 작업 중...", role, writer_key)
     writer_response, writer_name = _call_model_or_cli(writer_key, messages, system_prompt, writer_profile)
 
-    if "[Error]" in writer_response or "[CLI Error]" in writer_response:
+    if writer_response.startswith(_ERR_PREFIXES):
         return writer_response, {"dual": True, "error": "writer_failed"}
 
-    # 2단계: Auditor 리뷰 - v2.4.2 강화된 프롬프트
-    auditor_prompt = f"""당신은 {role} 작업의 Auditor(감사관)입니다.
-
-## 절대 규칙 (위반 시 즉시 무효)
-1. **수정 금지**: "내가 고쳐줄게요" 절대 금지. 오직 판정만.
-2. **인용 필수**: 모든 지적은 파일경로/함수명/라인/에러 재현 커맨드로 증거 제시.
-3. **Lazy Approval**: must_fix는 Severity HIGH만 허용:
-   - 보안 취약점, 데이터 손상, 크래시, 테스트 부재, 요구사항 불일치
-4. **스타일/취향** = nice_to_fix로만 (반려 사유 불가)
-
-=== WRITER 결과물 ===
-{writer_response}
-======================
-
-**반드시 아래 JSON 형식으로만 응답 (코드블록 없이):**
-
-{{
-  "verdict": "APPROVE | REVISE | REJECT",
-  "must_fix": [{{"severity": "HIGH", "issue": "문제", "evidence": "파일:라인", "fix_hint": "방향"}}],
-  "nice_to_fix": ["권장사항"],
-  "evidence": ["검증한 파일/함수 목록"],
-  "risk_level": "LOW | MEDIUM | HIGH | CRITICAL",
-  "requires_council": false,
-  "confidence": 85
-}}
-"""
+    # 2단계: Auditor 리뷰 - V3와 같은 정적 프롬프트 공유 (V2 사본은 stale했음)
+    auditor_prompt = (
+        _auditor_static_prompt(role)
+        + f"\n=== WRITER 결과물 ===\n{writer_response}\n======================\n"
+    )
 
-    auditor_messages = messages.copy()
-    auditor_messages.append({"role": "assistant", "content": writer_response})
-    auditor_messages.append({"role": "user", "content": auditor_prompt})
+    auditor_messages = [
+        *messages,
+        {"role": "assistant", "content": writer_response},
+        {"role": "user", "content": auditor_prompt},
+    ]
 
-    print(f"[Dual-V2] {role} Auditor ({auditor_key}) 리뷰 중...")
+    dual_log.info("[Dual-V2] %s Auditor (%s) 리뷰 중...", role, auditor_key)
     auditor_response, auditor_name = _call_model_or_cli(auditor_key, auditor_messages, system_prompt, auditor_profile)
 
     # 결과 병합
@@ -1006,11 +1412,9 @@ async def call_council_llm(
 
     모든 위원회 멤버가 Claude Code CLI를 사용
     """
-    from src.services.cli_supervisor import CLISupervisor
-
     print(f"[Council-CLI] {persona_id} → Claude Code CLI")
 
-    cli_supervisor = CLISupervisor()
+    cli_supervisor = get_supervisor()
 
     # CLI 호출 (reviewer 프로필 - 읽기 전용)
     result = cli_supervisor.call_cli(
@@ -1037,7 +1441,7 @@ def init_council_with_llm():
     reset_council()
     council = get_council()
 
-    cli_supervisor = CLISupervisor()
+    cli_supervisor = get_supervisor()
 
     async def council_cli_caller(
         system_prompt: str,
@@ -1071,13 +1475,20 @@ def init_council_with_llm():
                 print(f"[Council-CLI] Error: {error_msg}")
                 return f"[CLI ERROR] {error_msg}"
 
-        return await asyncio.get_event_loop().run_in_executor(None, sync_cli_call)
+        # 페르소나별 독립 스레드로 실행 - gather된 위원들이 실제로 동시 진행
+        return await asyncio.to_thread(sync_cli_call)
 
     council.set_llm_caller(council_cli_caller)
     print("[Council] CLI Caller 주입 완료 (Claude Code CLI 사용)")
     return council
 
 
+# 문자열 탐지 폴백용 DFA (1패스 스캔 - lower() 복사본/키워드별 재스캔 제거)
+_DECISION_RE = re.compile(r"전략|strategy|방향|decision|결정|plan|아키텍처|architecture", re.IGNORECASE)
+_RISK_RE = re.compile(r"risk|리스크|위험|주의|경고|warning|critical", re.IGNORECASE)
+_RISK_PATTERN_RE = re.compile(r"⚠️|❌|🚨|REJECT|HOLD|critical issue")  # 대소문자 구분 유지
+
+
 def should_convene_council(
     agent_role: str,
     response: str,
@@ -1110,79 +1521,66 @@ def should_convene_council(
     dual_meta = dual_meta or {}
 
     # =========================================================================
-    # 1순위: dual_meta의 requires_council 필드 (JSON 기반)
+    # 1·2순위: dual_meta JSON 기반 (단일 스캔 - 트리거 소스 판정과 공유)
     # =========================================================================
-    if dual_meta.get("requires_council") is True:
-        print(f"[Council] JSON 기반 트리거: requires_council=True (verdict: {dual_meta.get('verdict', 'N/A')})")
+    needs_council, trigger_source = _analyze_dual_meta(dual_meta)
+    if needs_council:
+        dual_log.info("[Council] JSON 기반 트리거: %s (verdict: %s)",
+                      trigger_source, dual_meta.get('verdict', 'N/A'))
         return "pm"
 
-    # REJECT verdict면 무조건 Council
-    if dual_meta.get("verdict") == "REJECT":
-        print("[Council] JSON 기반 트리거: verdict=REJECT")
-        return "pm"
-
-    # MAX_REWRITE_EXHAUSTED면 Council 권장
-    if dual_meta.get("verdict") == "MAX_REWRITE_EXHAUSTED":
-        print("[Council] JSON 기반 트리거: MAX_REWRITE_EXHAUSTED")
-        return "pm"
-
-    # =========================================================================
-    # 2순위: audit_history에서 requires_council 체크
-    # =========================================================================
-    audit_history = dual_meta.get("audit_history", [])
-    for audit in audit_history:
-        if audit.get("requires_council") is True:
-            print(f"[Council] audit_history 트리거: requires_council=True")
-            return "pm"
-
     # =========================================================================
     # 3순위: 문자열 탐지 (폴백 - 레거시 호환)
     # =========================================================================
     # 중요한 의사결정 감지 (전략/방향/결정)
-    decision_keywords = ["전략", "strategy", "방향", "decision", "결정", "plan", "아키텍처", "architecture"]
-    if any(kw in response.lower() for kw in decision_keywords):
-        if len(response) > 500:  # 긴 응답일 때만
-            print("[Council] 문자열 탐지 트리거: decision keywords")
-            return "pm"
+    if len(response) > 500 and _DECISION_RE.search(response):  # 긴 응답일 때만
+        dual_log.info("[Council] 문자열 탐지 트리거: decision keywords")
+        return "pm"
 
     # 리스크 관련 감지
-    risk_keywords = ["risk", "리스크", "위험", "주의", "경고", "warning", "critical"]
-    if any(kw in response.lower() for kw in risk_keywords):
+    if _RISK_RE.search(response):
         # 단순 언급이 아닌 실제 경고인지 확인 (문맥 체크)
-        risk_patterns = ["⚠️", "❌", "🚨", "REJECT", "HOLD", "critical issue"]
-        if any(p in response for p in risk_patterns):
-            print("[Council] 문자열 탐지 트리거: risk patterns")
+        if _RISK_PATTERN_RE.search(response):
+            dual_log.info("[Council] 문자열 탐지 트리거: risk patterns")
             return "pm"
 
     return None
 
 
-def _determine_trigger_source(dual_meta: Dict) -> str:
+def _analyze_dual_meta(dual_meta: Dict) -> Tuple[bool, str]:
     """
-    dual_meta에서 Council 트리거 소스 결정 (v2.3.3)
+    dual_meta 단일 스캔으로 (Council 필요 여부, 트리거 소스) 동시 결정
 
-    Returns:
-        트리거 소스 문자열
+    should_convene_council과 _determine_trigger_source가 각자 같은
+    딕셔너리/히스토리를 재스캔하던 것을 한 곳으로 통합.
     """
     if not dual_meta:
-        return "manual"
+        return False, "manual"
 
     verdict = dual_meta.get("verdict", "")
 
     if verdict == "REJECT":
-        return "json_verdict_reject"
-    elif verdict == "MAX_REWRITE_EXHAUSTED":
-        return "json_verdict_max_rewrite"
-    elif dual_meta.get("requires_council") is True:
-        return "json_requires_council"
+        return True, "json_verdict_reject"
+    if verdict == "MAX_REWRITE_EXHAUSTED":
+        return True, "json_verdict_max_rewrite"
+    if dual_meta.get("requires_council") is True:
+        return True, "json_requires_council"
+
+    # audit_history에서 requires_council 확인 (첫 매치에서 중단)
+    if any(a.get("requires_council") is True for a in dual_meta.get("audit_history", ())):
+        return True, "json_requires_council"
 
-    # audit_history에서 requires_council 확인
-    audit_history = dual_meta.get("audit_history", [])
-    for audit in audit_history:
-        if audit.get("requires_council") is True:
-            return "json_requires_council"
+    return False, "keyword_detection"
 
-    return "keyword_detection"
+
+def _determine_trigger_source(dual_meta: Dict) -> str:
+    """
+    dual_meta에서 Council 트리거 소스 결정 (v2.3.3)
+
+    Returns:
+        트리거 소스 문자열
+    """
+    return _analyze_dual_meta(dual_meta)[1]
 
 
 async def convene_council_async(
@@ -1266,6 +1664,37 @@ def convene_council_sync(
 # 루프 브레이커 (Loop Breaker)
 # =============================================================================
 
+_SIMHASH_BITS = 64
+_SIMHASH_MASK = (1 << _SIMHASH_BITS) - 1
+
+
+def _simhash(text: str) -> int:
+    """
+    64비트 SimHash 지문 생성
+
+    토큰 해시의 비트별 다수결 - 유사한 텍스트는 해밍 거리가 가깝다.
+    저장은 int 8바이트, 비교는 XOR + popcount O(1).
+    """
+    acc = [0] * _SIMHASH_BITS
+    for tok in text.lower().split():
+        h = hash(tok) & _SIMHASH_MASK
+        for i in range(_SIMHASH_BITS):
+            if h >> i & 1:
+                acc[i] += 1
+            else:
+                acc[i] -= 1
+    fingerprint = 0
+    for i in range(_SIMHASH_BITS):
+        if acc[i] > 0:
+            fingerprint |= 1 << i
+    return fingerprint
+
+
+def _simhash_similarity(h1: int, h2: int) -> float:
+    """두 SimHash 간 유사도 (1 - 정규화 해밍 거리)"""
+    return 1.0 - (h1 ^ h2).bit_count() / _SIMHASH_BITS
+
+
 class LoopBreaker:
     """
     에이전트 루프 감지 및 차단
@@ -1279,7 +1708,8 @@ class LoopBreaker:
     def __init__(self):
         self.step_count = 0
         self.stage_retries: Dict[str, int] = {}
-        self.response_history: list = []
+        # 최근 3개 지문만 비교에 쓰이므로 상한 있는 deque로 유지
+        self.response_history: deque = deque(maxlen=3)
         self.is_broken = False
         self.break_reason = None
 
@@ -1287,26 +1717,10 @@ class LoopBreaker:
         """브레이커 초기화"""
         self.step_count = 0
         self.stage_retries = {}
-        self.response_history = []
+        self.response_history = deque(maxlen=3)
         self.is_broken = False
         self.break_reason = None
 
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """두 텍스트의 유사도 계산 (간단한 Jaccard)"""
-        if not text1 or not text2:
-            return 0.0
-
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-
-        if not words1 or not words2:
-            return 0.0
-
-        intersection = words1 & words2
-        union = words1 | words2
-
-        return len(intersection) / len(union)
-
     def check_and_update(self, stage: str, response: str) -> Tuple[bool, Optional[str]]:
         """
         루프 체크 및 상태 업데이트
@@ -1334,16 +1748,17 @@ class LoopBreaker:
             self.break_reason = f"MAX_STAGE_RETRY 초과: {stage} ({self.stage_retries[stage]}회)"
             return True, self.break_reason
 
-        # 3. 반복 응답 감지
-        for prev_response in self.response_history[-3:]:  # 최근 3개와 비교
-            similarity = self._calculate_similarity(response, prev_response)
+        # 3. 반복 응답 감지 (SimHash 지문 - 응답당 1회 해시, 비교는 XOR popcount)
+        fingerprint = _simhash(response)
+        for prev_fingerprint in self.response_history:  # maxlen=3 → 항상 최근 3개
+            similarity = _simhash_similarity(fingerprint, prev_fingerprint)
             if similarity > config["SIMILARITY_THRESHOLD"]:
                 self.is_broken = True
                 self.break_reason = f"반복 응답 감지 (유사도: {similarity:.2%})"
                 return True, self.break_reason
 
-        # 4. 응답 히스토리 저장
-        self.response_history.append(response[:1000])  # 처음 1000자만
+        # 4. 응답 히스토리 저장 (원문 대신 8바이트 지문)
+        self.response_history.append(fingerprint)
 
         return False, None
 
@@ -1392,6 +1807,10 @@ def check_loop(stage: str, response: str) -> Tuple[bool, Optional[str]]:
 # Agent Call
 # =============================================================================
 
+# 모듈 로드 시 1회 컴파일 (모든 call_agent 호출이 거치는 핫패스)
+_PROJECT_TAG_RE = re.compile(r'\[PROJECT:\s*([^\]]+)\]\s*\n?(.*)', re.DOTALL)
+
+
 def extract_project_from_message(message: str) -> tuple[str, str]:
     """
     [PROJECT: xxx] 태그에서 프로젝트명 추출
@@ -1403,12 +1822,12 @@ def extract_project_from_message(message: str) -> tuple[str, str]:
         "[PROJECT: test]\n안녕" → ("test", "안녕")
         "그냥 메시지" → (None, "그냥 메시지")
     """
-    import re
-    match = re.match(r'\[PROJECT:\s*([^\]]+)\]\s*\n?(.*)', message, re.DOTALL)
+    # 대부분의 메시지는 태그가 없음 - 정규식 전에 빠른 탈출
+    if not message.startswith('[PROJECT:'):
+        return None, message
+    match = _PROJECT_TAG_RE.match(message)
     if match:
-        project = match.group(1).strip()
-        remaining = match.group(2).strip()
-        return project, remaining
+        return match.group(1).strip(), match.group(2).strip()
     return None, message
 
 
@@ -1471,17 +1890,29 @@ CEO는 하위 에이전트(`{agent_role}`)를 직접 호출할 수 없습니다.
     current_session_id = get_current_session()
     start_time = time_module.time()
 
-    # 디버그: 입력 메시지 확인
-    import sys
-    sys.stderr.write(f"[DEBUG-INPUT] message[:50]={message[:50] if len(message) > 50 else message}\n")
-    sys.stderr.write(f"[DEBUG-INPUT] agent_role={agent_role}, _internal_call={_internal_call}\n")
-    sys.stderr.flush()
+    # 디버그: 입력 메시지 확인 (DEBUG 레벨에서만 포맷/출력)
+    agent_log.debug("[DEBUG-INPUT] message[:50]=%s", message[:50])
+    agent_log.debug("[DEBUG-INPUT] agent_role=%s, _internal_call=%s", agent_role, _internal_call)
 
     # [PROJECT: xxx] 태그에서 프로젝트 추출
     current_project, message_without_project = extract_project_from_message(message)
     if current_project:
         print(f"[Project] Detected: {current_project}")
 
+    # =========================================================================
+    # v2.6.10: 시맨틱 응답 캐시 (opt-in: AGENT_RESPONSE_CACHE=1)
+    # - 거의 같은 질문 반복 시 LLM 왕복 생략
+    # - [EXEC] 포함 메시지는 부작용(명령 실행)이 있으므로 캐시 금지
+    # =========================================================================
+    cacheable = not (auto_execute and "[EXEC]" in message)
+    if cacheable:
+        cached_response = semantic_cache.lookup(agent_role, current_project, message_without_project)
+        if cached_response is not None:
+            print(f"[SemanticCache] HIT {agent_role} ({len(cached_response)}자)")
+            if return_meta:
+                return cached_response, {"cached": True, "cache_type": "semantic"}
+            return cached_response
+
     router = get_router()
     routing = route_message(message, agent_role)
 
@@ -1603,7 +2034,7 @@ CEO는 하위 에이전트(`{agent_role}`)를 직접 호출할 수 없습니다.
     # =========================================================================
     # 듀얼 엔진 V3 사용 (Write → Audit → Rewrite 패턴)
     # =========================================================================
-    if use_dual_engine and agent_role in DUAL_ENGINE_ROLES:
+    if use_dual_engine and agent_role in _VALID_DUAL_ENGINE_ROLES:
         print(f"[Dual-V3] {agent_role} Write-Audit-Rewrite 패턴 활성화")
         response, dual_meta = dual_engine_write_audit_rewrite(agent_role, messages, system_prompt, session_id=current_session_id)
 
@@ -1641,9 +2072,11 @@ CEO는 하위 에이전트(`{agent_role}`)를 직접 호출할 수 없습니다.
 
 위 피드백을 반영하여 응답을 수정해주세요."""
 
-                        rewrite_messages = messages.copy()
-                        rewrite_messages.append({"role": "assistant", "content": response})
-                        rewrite_messages.append({"role": "user", "content": rewrite_prompt})
+                        rewrite_messages = [
+                            *messages,
+                            {"role": "assistant", "content": response},
+                            {"role": "user", "content": rewrite_prompt},
+                        ]
 
                         # 재수정 호출
                         response, dual_meta = dual_engine_write_audit_rewrite(agent_role, rewrite_messages, system_prompt, session_id=current_session_id)
@@ -1869,6 +2302,10 @@ CEO는 하위 에이전트(`{agent_role}`)를 직접 호출할 수 없습니다.
         print(f"[FormatGate] SKIP {agent_role} - [CALL:agent] tag response")
         model_meta['format_validated'] = True  # CALL 태그는 유효한 PM 출력 형식
 
+    # v2.6.10: 성공 응답만 시맨틱 캐시에 저장 (에러/ABORT 제외)
+    if cacheable and not response.startswith(_ERR_PREFIXES) and not is_abort_response:
+        semantic_cache.store(agent_role, current_project, message_without_project, response)
+
     if return_meta:
         return response, model_meta
     return response
@@ -1893,11 +2330,13 @@ def process_call_tags(pm_response: str, use_loop_breaker: bool = True) -> list:
         loop_breaker = get_loop_breaker()
         # 새 PM 호출이면 리셋하지 않음 (연속 작업 추적)
 
+    # 1단계: 디스패치 전 루프 브레이커 체크 (저렴한 검사 - 직렬)
+    # 브레이크 발생 지점 이후의 호출은 디스패치하지 않음
+    dispatchable = []
     for call in calls:
         agent = call['agent']
         message = call['message']
 
-        # 루프 브레이커 체크
         if use_loop_breaker:
             should_break, break_reason = check_loop(agent, message)
             if should_break:
@@ -1918,11 +2357,34 @@ def process_call_tags(pm_response: str, use_loop_breaker: bool = True) -> list:
                 break  # 더 이상 에이전트 호출하지 않음
 
         print(f"[CALL] PM → {agent}: {message[:100]}...")
+        dispatchable.append(call)
+
+    if not dispatchable:
+        return results
+
+    # 2단계: 승인된 호출을 동시 디스패치 (서로 독립적인 LLM 왕복)
+    # 전체 대기 시간 = 합이 아닌 가장 느린 에이전트 시간
+    # PM이 서브에이전트 호출 시 _internal_call=True (CEO 직접 호출 차단 우회)
+    if len(dispatchable) == 1:
+        responses = [call_agent(
+            dispatchable[0]['message'], dispatchable[0]['agent'],
+            auto_execute=True, use_translation=False, _internal_call=True
+        )]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(dispatchable), 4)) as pool:
+            futures = [
+                pool.submit(
+                    call_agent, call['message'], call['agent'],
+                    auto_execute=True, use_translation=False, _internal_call=True
+                )
+                for call in dispatchable
+            ]
+            responses = [f.result() for f in futures]  # 제출 순서 유지
 
-        # PM이 서브에이전트 호출 시 _internal_call=True (CEO 직접 호출 차단 우회)
-        response = call_agent(message, agent, auto_execute=True, use_translation=False, _internal_call=True)
+    # 3단계: 응답 기반 루프 체크 + 결과 조립 (원래 순서대로 직렬)
+    for call, response in zip(dispatchable, responses):
+        agent = call['agent']
 
-        # 응답 기반 루프 체크
         if use_loop_breaker:
             should_break, break_reason = check_loop(f"{agent}_response", response)
             if should_break:
@@ -1931,7 +2393,7 @@ def process_call_tags(pm_response: str, use_loop_breaker: bool = True) -> list:
 
         results.append({
             'agent': agent,
-            'message': message,
+            'message': call['message'],
             'response': response
         })
 
@@ -0,0 +1,126 @@
+"""
+Hattz Empire - Semantic Response Cache (v2.6.10)
+
+에이전트 응답의 의미 기반 캐시.
+거의 같은 질문이 반복될 때 LLM 왕복 없이 이전 응답을 재사용한다.
+
+설계:
+- 임베딩 모델 의존성 없이 64-bit SimHash로 메시지 지문 생성
+  (llm_caller의 듀얼 엔진 시맨틱 캐시와 동일한 방식)
+- 유사도 임계치 0.92 이상이면 히트
+- 에이전트별 TTL: researcher는 최신성이 중요하므로 짧게
+- 기본 비활성. AGENT_RESPONSE_CACHE=1 환경변수로 opt-in
+"""
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
+# 캐시 활성화 여부 (기본 OFF - 명시적 opt-in)
+SEMANTIC_CACHE_ENABLED = os.environ.get("AGENT_RESPONSE_CACHE", "0") == "1"
+
+# 유사도 임계치 (SimHash Hamming 유사도)
+_SIMILARITY_THRESHOLD = 0.92
+
+# 에이전트별 TTL (초). 명시 안 된 에이전트는 기본값 사용
+_AGENT_TTL = {
+    "researcher": 300,      # 최신 정보 검색 - 5분
+    "analyst": 600,         # 로그/프로젝트 분석 - 10분
+    "pm": 0,                # 라우팅 결정은 캐시 금지 (상태 의존)
+}
+_DEFAULT_TTL = 1800  # 30분
+
+_MAX_ENTRIES = 256
+
+_SIMHASH_BITS = 64
+_SIMHASH_MASK = (1 << _SIMHASH_BITS) - 1
+
+# (agent_role, project, fingerprint, response, stored_at) 리스트
+_entries: list = []
+_lock = threading.Lock()
+
+
+def _simhash(text: str) -> int:
+    """토큰 해시의 비트 다수결로 64-bit 지문 생성"""
+    tokens = text.lower().split()
+    if not tokens:
+        return 0
+    acc = [0] * _SIMHASH_BITS
+    for tok in tokens:
+        h = hash(tok) & _SIMHASH_MASK
+        for i in range(_SIMHASH_BITS):
+            if h & (1 << i):
+                acc[i] += 1
+            else:
+                acc[i] -= 1
+    fp = 0
+    for i in range(_SIMHASH_BITS):
+        if acc[i] > 0:
+            fp |= 1 << i
+    return fp
+
+
+def _similarity(h1: int, h2: int) -> float:
+    """Hamming 거리 기반 유사도 (0.0 ~ 1.0)"""
+    return 1.0 - (h1 ^ h2).bit_count() / _SIMHASH_BITS
+
+
+def _ttl_for(agent_role: str) -> int:
+    return _AGENT_TTL.get(agent_role, _DEFAULT_TTL)
+
+
+def lookup(agent_role: str, project: Optional[str], message: str) -> Optional[str]:
+    """
+    유사한 이전 질문의 응답 조회
+
+    Returns:
+        캐시된 응답 또는 None (미스)
+    """
+    if not SEMANTIC_CACHE_ENABLED:
+        return None
+    ttl = _ttl_for(agent_role)
+    if ttl <= 0:
+        return None
+
+    fp = _simhash(message)
+    now = time.time()
+    with _lock:
+        # 만료 항목 정리
+        _entries[:] = [e for e in _entries if now - e[4] < _ttl_for(e[0])]
+        for role, proj, entry_fp, response, _stored in _entries:
+            if role != agent_role or proj != project:
+                continue
+            if _similarity(fp, entry_fp) >= _SIMILARITY_THRESHOLD:
+                return response
+    return None
+
+
+def store(agent_role: str, project: Optional[str], message: str, response: str) -> None:
+    """성공한 응답을 캐시에 저장 (에러 응답은 호출부에서 걸러야 함)"""
+    if not SEMANTIC_CACHE_ENABLED:
+        return
+    if _ttl_for(agent_role) <= 0:
+        return
+
+    fp = _simhash(message)
+    with _lock:
+        _entries.append((agent_role, project, fp, response, time.time()))
+        if len(_entries) > _MAX_ENTRIES:
+            del _entries[: len(_entries) - _MAX_ENTRIES]
+
+
+def clear() -> None:
+    """캐시 전체 비우기 (테스트/운영용)"""
+    with _lock:
+        _entries.clear()
+
+
+def stats() -> dict:
+    """캐시 상태 조회"""
+    with _lock:
+        return {
+            "enabled": SEMANTIC_CACHE_ENABLED,
+            "entries": len(_entries),
+            "max_entries": _MAX_ENTRIES,
+            "threshold": _SIMILARITY_THRESHOLD,
+        }
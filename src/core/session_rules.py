@@ -10,11 +10,18 @@ CEO 가이드라인에 따른 설계:
 """
 import json
 import hashlib
+import re
 from dataclasses import dataclass, field, asdict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 
+# Reviewer 출력의 JSON 블록 패턴 — 호출마다 재컴파일하지 않도록 모듈 로드 시 1회 컴파일
+_REVIEWER_JSON_PATTERNS = [
+    re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL),       # markdown code block
+    re.compile(r'(\{[^{}]*"verdict"[^{}]*\})', re.DOTALL),      # inline JSON (간단한 경우)
+]
+
 
 # =============================================================================
 # CONSTITUTION (헌법) - 절대 금지, 어떤 세션에서도 우회 불가
@@ -87,9 +94,9 @@ class SessionRules:
         return json.dumps(asdict(self), ensure_ascii=False, indent=2)
 
     def get_hash(self) -> str:
-        """규정의 해시값 생성 (감사 추적용)"""
+        """규정의 해시값 생성 (감사 추적용, blake2b 8바이트 = 16 hex)"""
         json_str = json.dumps(asdict(self), sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(json_str.encode()).hexdigest()[:16]
+        return hashlib.blake2b(json_str.encode(), digest_size=8).hexdigest()
 
     @classmethod
     def from_json(cls, json_str: str) -> "SessionRules":
@@ -379,16 +386,9 @@ def parse_reviewer_output(output: str) -> Optional[ReviewResult]:
 
     JSON 블록을 찾아 파싱
     """
-    import re
-
-    # JSON 블록 찾기
-    json_patterns = [
-        r'```json\s*(\{.*?\})\s*```',  # markdown code block
-        r'(\{[^{}]*"verdict"[^{}]*\})',  # inline JSON (간단한 경우)
-    ]
-
-    for pattern in json_patterns:
-        match = re.search(pattern, output, re.DOTALL)
+    # JSON 블록 찾기 (사전 컴파일된 패턴 사용)
+    for pattern in _REVIEWER_JSON_PATTERNS:
+        match = pattern.search(output)
         if match:
             try:
                 data = json.loads(match.group(1))
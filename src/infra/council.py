@@ -526,7 +526,9 @@ CEO 검토: {'필요' if result.requires_ceo else '불필요'}
         )
 
         # v2.3.1: 개별 페르소나 판정을 DB에 저장 (is_internal=True)
-        self._save_persona_judgment_to_db(
+        # 동기 DB 쓰기가 이벤트 루프를 막지 않도록 스레드로 넘김
+        await asyncio.to_thread(
+            self._save_persona_judgment_to_db,
             persona=persona,
             judge_score=judge_score,
             council_type=council_type or self.current_council_type or "unknown",